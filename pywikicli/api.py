@@ -3,11 +3,20 @@ MediaWiki API client implementations for PyWikiCLI.
 """
 
 import logging
+import os
 import requests
-import json
+import threading
+import time
 import urllib.parse
-from typing import Dict, List, Optional, Any
-
+from functools import lru_cache
+from http.cookiejar import LoadError, LWPCookieJar
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+
+from pywikicli.cache import PageCache, MISSING_PAGE_TTL
+from pywikicli.jsonutil import dumps, loads
 from pywikicli.interfaces import (
     AuthenticationService,
     PageService,
@@ -18,6 +27,319 @@ from pywikicli.interfaces import (
 
 logger = logging.getLogger(__name__)
 
+_quote = urllib.parse.quote
+
+# Page titles use underscores instead of spaces in URLs
+_TITLE_TO_PATH = str.maketrans(" ", "_")
+
+
+@lru_cache(maxsize=65536)
+def _title_to_url_path(page_title: str) -> str:
+    """
+    Encode a page title as the path segment of its URL.
+    Memoized, since the same titles are looked up repeatedly.
+
+    Args:
+        page_title: Title of the wiki page
+
+    Returns:
+        str: URL-encoded path segment
+    """
+    return _quote(page_title.translate(_TITLE_TO_PATH))
+
+
+# MediaWiki accepts at most 50 titles per query for regular users
+MAX_TITLES_PER_REQUEST = 50
+
+# Limit for accounts with the apihighlimits right (bots, sysops)
+MAX_TITLES_PER_REQUEST_HIGH = 500
+
+# Connection pool sizing; keeps connections warm for concurrent crawls
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# How often a request failing with a transient server error is retried
+MAX_TRANSIENT_RETRIES = 5
+
+# Seconds of database replication lag at which the server asks us to back off
+DEFAULT_MAXLAG = 5
+
+# Default ceiling for the request rate, in requests per minute
+DEFAULT_RATE_LIMIT = 120
+
+# How often a request is retried after the server asked us to back off
+MAX_BACKOFF_RETRIES = 5
+
+# Seconds to wait for the server before giving up on a request
+DEFAULT_TIMEOUT = 30.0
+
+
+class RateLimiter:
+    """
+    Adaptive request pacing shared by every thread using a session.
+    Starts at the configured rate, halves it whenever the server signals
+    overload and recovers gradually while requests succeed.
+    """
+
+    # Lowest rate the limiter backs off to, in requests per second
+    MIN_RATE = 0.1
+
+    def __init__(self, requests_per_minute: Optional[float] = DEFAULT_RATE_LIMIT):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Maximum request rate, None or 0 for unlimited
+        """
+        self.max_rate = requests_per_minute / 60.0 if requests_per_minute else None
+        self.rate = self.max_rate
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self) -> None:
+        """Block until the next request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + (1.0 / self.rate if self.rate else 0.0)
+        if start > now:
+            time.sleep(start - now)
+
+    def backoff(self, delay: float) -> None:
+        """
+        Slow down after the server signalled overload.
+
+        Args:
+            delay: Seconds no request should be sent for
+        """
+        with self._lock:
+            self._next_time = max(self._next_time, time.monotonic() + delay)
+            if self.rate:
+                self.rate = max(self.MIN_RATE, self.rate / 2)
+
+    def success(self) -> None:
+        """Recover towards the configured rate after a successful request."""
+        if self.rate and self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+class MediaWikiSession(requests.Session):
+    """
+    HTTP session that paces API requests and honours server back-off signals.
+    Adds maxlag to every API request and retries after Retry-After when the
+    server reports replication lag or rate limiting.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        maxlag: Optional[int] = DEFAULT_MAXLAG,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ):
+        """
+        Initialize the session.
+
+        Args:
+            rate_limiter: Limiter pacing requests, None for no pacing
+            maxlag: maxlag parameter added to API requests, None to omit it
+            timeout: Default request timeout in seconds, None to wait forever
+        """
+        super().__init__()
+        self.rate_limiter = rate_limiter
+        self.maxlag = maxlag
+        self.timeout = timeout
+
+    def request(self, method, url, params=None, data=None, **kwargs):
+        """
+        Send a request, backing off and retrying while the server is overloaded.
+        """
+        # A stalled connection must not block a crawler worker forever
+        kwargs.setdefault("timeout", self.timeout)
+
+        payload = data if method.upper() == "POST" else params
+        if (
+            self.maxlag is not None
+            and isinstance(payload, dict)
+            and "action" in payload
+        ):
+            payload = {**payload, "maxlag": self.maxlag}
+            if method.upper() == "POST":
+                data = payload
+            else:
+                params = payload
+
+        for attempt in range(MAX_BACKOFF_RETRIES + 1):
+            if self.rate_limiter:
+                self.rate_limiter.wait()
+            response = super().request(method, url, params=params, data=data, **kwargs)
+
+            overloaded = (
+                response.status_code in (429, 503)
+                or response.headers.get("MediaWiki-API-Error") == "maxlag"
+            )
+            if not overloaded or attempt == MAX_BACKOFF_RETRIES:
+                if not overloaded and self.rate_limiter:
+                    self.rate_limiter.success()
+                return response
+
+            try:
+                delay = float(response.headers.get("Retry-After", DEFAULT_MAXLAG))
+            except ValueError:
+                delay = DEFAULT_MAXLAG
+            logger.warning(f"Server asked to back off, retrying in {delay:g}s")
+            if self.rate_limiter:
+                self.rate_limiter.backoff(delay)
+            else:
+                time.sleep(delay)
+
+        return response
+
+
+def create_session(
+    rate_limit: Optional[float] = DEFAULT_RATE_LIMIT,
+    pool_maxsize: int = POOL_MAXSIZE,
+) -> requests.Session:
+    """
+    Create an HTTP session tuned for the MediaWiki API.
+    Connections are pooled and kept alive, transient failures retried and
+    requests paced to stay within the server's limits.
+
+    Args:
+        rate_limit: Maximum requests per minute, None or 0 for unlimited
+        pool_maxsize: Connections kept alive per host; should be at least the
+            number of threads sharing the session, or the surplus connections
+            are closed after each request and reopened with a new handshake
+
+    Returns:
+        requests.Session: Configured session
+    """
+    session = MediaWikiSession(RateLimiter(rate_limit))
+    # urllib3 adds "br" to ACCEPT_ENCODING when a Brotli decoder is installed
+    session.headers.update(
+        {"User-Agent": "PyWikiCLI/0.1", "Accept-Encoding": ACCEPT_ENCODING}
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize,
+        # Only idempotent methods are resent: a POST may be an edit or login
+        # that the server already applied before failing
+        max_retries=Retry(
+            total=MAX_TRANSIENT_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=[500, 502, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def parse_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON API response, using orjson when it is installed.
+
+    Args:
+        response: HTTP response with a JSON body
+
+    Returns:
+        Any: Decoded JSON data
+    """
+    return loads(response.content)
+
+
+def dump_json(data: Any) -> str:
+    """
+    Pretty-print JSON data for debug output, using orjson when it is installed.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        str: Indented JSON text
+    """
+    return dumps(data, indent=True)
+
+
+def _chunked(items: List[str], size: int):
+    """
+    Split a list into consecutive chunks.
+
+    Args:
+        items: Items to split
+        size: Maximum chunk size
+
+    Yields:
+        List[str]: Chunks of at most size items
+    """
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _title_aliases(query: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Build a map from requested titles to the titles MediaWiki answered with.
+
+    Args:
+        query: The "query" part of an API response
+
+    Returns:
+        Dict[str, str]: Requested title -> normalized/redirect target title
+    """
+    aliases = {}
+    for key in ("normalized", "redirects"):
+        for entry in query.get(key, []):
+            aliases[entry["from"]] = entry["to"]
+    return aliases
+
+
+def _resolve_title(title: str, aliases: Dict[str, str]) -> str:
+    """
+    Follow normalization and redirect entries for a requested title.
+
+    Args:
+        title: Title as requested
+        aliases: Map produced by _title_aliases
+
+    Returns:
+        str: Title of the page MediaWiki returned for the request
+    """
+    seen = set()
+    while title in aliases and title not in seen:
+        seen.add(title)
+        title = aliases[title]
+    return title
+
+
+class MediaWikiApiError(Exception):
+    """
+    Error reported in the body of an API response, e.g. readapidenied.
+    """
+
+    def __init__(self, code: str, info: str = ""):
+        """
+        Initialize the error.
+
+        Args:
+            code: MediaWiki error code
+            info: Human readable description
+        """
+        super().__init__(f"{code}: {info}" if info else code)
+        self.code = code
+
+
+def _raise_for_api_error(data: Dict[str, Any]) -> None:
+    """
+    Raise MediaWikiApiError if an API response reports an error.
+
+    Args:
+        data: Decoded API response
+    """
+    error = data.get("error")
+    if error is not None:
+        raise MediaWikiApiError(error.get("code", "unknown"), error.get("info", ""))
+
 
 class MediaWikiAuth(AuthenticationService):
     """
@@ -25,7 +347,14 @@ class MediaWikiAuth(AuthenticationService):
     Handles login and session management.
     """
 
-    def __init__(self, api_url: str, username: str = None, password: str = None):
+    def __init__(
+        self,
+        api_url: str,
+        username: str = None,
+        password: str = None,
+        session: Optional[requests.Session] = None,
+        cookie_path: Optional[str] = None,
+    ):
         """
         Initialize the authentication service.
 
@@ -33,13 +362,19 @@ class MediaWikiAuth(AuthenticationService):
             api_url: URL of the MediaWiki API endpoint
             username: Username for authentication
             password: Password for authentication
+            session: Optional requests session to use
+            cookie_path: Optional file keeping the session cookies between
+                runs, so a still valid login is reused
         """
         self.api_url = api_url
         self.username = username
         self.password = password
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "PyWikiCLI/0.1"})
+        self.session = session or create_session()
+        self.cookie_path = cookie_path
         self._logged_in = False
+        self.rights = frozenset()
+        if cookie_path:
+            self._load_cookies()
 
     def login(self) -> bool:
         """
@@ -52,18 +387,22 @@ class MediaWikiAuth(AuthenticationService):
             logger.warning("No credentials provided, login skipped")
             return False
 
+        if self.cookie_path and self._resume_session():
+            return True
+
         # Step 1: Get login token
         params = {
             "action": "query",
             "meta": "tokens",
             "type": "login",
             "format": "json",
+            "formatversion": "2",
         }
 
         try:
             response = self.session.get(self.api_url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = parse_json(response)
             token = data["query"]["tokens"]["logintoken"]
 
             # Step 2: Send login request with token
@@ -73,19 +412,22 @@ class MediaWikiAuth(AuthenticationService):
                 "lgpassword": self.password,
                 "lgtoken": token,
                 "format": "json",
+                "formatversion": "2",
             }
 
             login_response = self.session.post(self.api_url, data=login_params)
             login_response.raise_for_status()
-            login_data = login_response.json()
+            login_data = parse_json(login_response)
 
             if login_data["login"]["result"] != "Success":
                 logger.error(f"Login failed: {login_data['login']['reason']}")
                 self._logged_in = False
                 return False
 
-            logger.debug(f"Successfully logged in as {self.username}")
+            logger.debug("Successfully logged in as %s", self.username)
             self._logged_in = True
+            self.rights = frozenset(self._fetch_userinfo().get("rights", ()))
+            self.save_cookies()
             return True
 
         except Exception as e:
@@ -102,6 +444,91 @@ class MediaWikiAuth(AuthenticationService):
         """
         return self._logged_in
 
+    @property
+    def titles_per_request(self) -> int:
+        """
+        Maximum number of titles the current user may send in one query.
+
+        Returns:
+            int: Title limit per request
+        """
+        if "apihighlimits" in self.rights:
+            return MAX_TITLES_PER_REQUEST_HIGH
+        return MAX_TITLES_PER_REQUEST
+
+    def save_cookies(self) -> None:
+        """
+        Write the session cookies to the cookie file, if one is configured.
+        """
+        if not self.cookie_path or not self._logged_in:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cookie_path) or ".", exist_ok=True)
+            # The cookies grant access to the account: create the file private
+            # before anything is written, and tighten an existing one
+            os.close(os.open(self.cookie_path, os.O_WRONLY | os.O_CREAT, 0o600))
+            os.chmod(self.cookie_path, 0o600)
+            self.session.cookies.save(ignore_discard=True)
+        except (OSError, AttributeError) as e:
+            logger.debug("Could not save cookies to %s: %s", self.cookie_path, e)
+
+    def _load_cookies(self) -> None:
+        """
+        Attach a cookie jar backed by the cookie file to the session.
+        """
+        jar = LWPCookieJar(self.cookie_path)
+        if os.path.exists(self.cookie_path):
+            try:
+                jar.load(ignore_discard=True)
+            except (OSError, LoadError) as e:
+                logger.debug("Ignoring unreadable cookie file: %s", e)
+        self.session.cookies = jar
+
+    def _resume_session(self) -> bool:
+        """
+        Reuse a login stored in the cookie file if it is still valid.
+
+        Returns:
+            bool: True if the session is logged in as the configured user
+        """
+        if not len(self.session.cookies):
+            return False
+        userinfo = self._fetch_userinfo()
+        # Bot passwords log in as "User@bot" but act as "User"
+        name = self.username.split("@", 1)[0].replace("_", " ").strip()
+        if (
+            not userinfo.get("id")
+            or userinfo.get("name") != name[:1].upper() + name[1:]
+        ):
+            return False
+        logger.debug("Reusing saved session of %s", userinfo["name"])
+        self._logged_in = True
+        self.rights = frozenset(userinfo.get("rights", ()))
+        return True
+
+    def _fetch_userinfo(self) -> Dict[str, Any]:
+        """
+        Look up the current user and their rights.
+
+        Returns:
+            Dict[str, Any]: User info (id, name, rights), empty if it could
+                not be retrieved
+        """
+        params = {
+            "action": "query",
+            "meta": "userinfo",
+            "uiprop": "rights",
+            "format": "json",
+            "formatversion": "2",
+        }
+        try:
+            response = self.session.get(self.api_url, params=params)
+            response.raise_for_status()
+            return parse_json(response)["query"]["userinfo"]
+        except Exception as e:
+            logger.debug("Could not retrieve user info: %s", e)
+            return {}
+
 
 class MediaWikiPageService(PageService):
     """
@@ -109,23 +536,34 @@ class MediaWikiPageService(PageService):
     Handles retrieving and editing pages.
     """
 
-    def __init__(self, api_url: str, auth_service: AuthenticationService):
+    def __init__(
+        self,
+        api_url: str,
+        auth_service: AuthenticationService,
+        cache: Optional[PageCache] = None,
+        refresh: bool = False,
+    ):
         """
         Initialize the page service.
 
         Args:
             api_url: URL of the MediaWiki API endpoint
             auth_service: Authentication service for API access
+            cache: Optional persistent cache for page content
+            refresh: Check cached pages against the wiki even if not expired
         """
         self.api_url = api_url
         self.auth_service = auth_service
+        self.cache = cache
+        self.titles_per_request = MAX_TITLES_PER_REQUEST
+        self.refresh = refresh
+        self._csrf_token = None
         # Use the session from auth_service for consistency
         if isinstance(auth_service, MediaWikiAuth):
             self.session = auth_service.session
         else:
             # Create a new session if auth_service is not MediaWikiAuth
-            self.session = requests.Session()
-            self.session.headers.update({"User-Agent": "PyWikiCLI/0.1"})
+            self.session = create_session()
 
     def get_page(self, title: str) -> Optional[str]:
         """
@@ -137,22 +575,56 @@ class MediaWikiPageService(PageService):
         Returns:
             Optional[str]: Page content as wikitext or None if page doesn't exist
         """
+        stale = None
+        if self.cache is not None:
+            if not self.refresh:
+                cached = self.cache.get(self._cache_key(title))
+                if cached is not None:
+                    return cached["content"]
+            stale = self.cache.get(self._cache_key(title), allow_expired=True)
+            if stale is not None and stale["content"] is None:
+                stale = None
+
+        # Revalidate an expired entry: with HTTP validators an unchanged page
+        # costs a 304 reply, otherwise compare revision ids first
+        headers = {}
+        if stale is not None:
+            if stale.get("etag"):
+                headers["If-None-Match"] = stale["etag"]
+            if stale.get("last_modified"):
+                headers["If-Modified-Since"] = stale["last_modified"]
+            if not headers and stale["revid"] is not None:
+                current = self._revalidate({title: stale})
+                if title in current:
+                    return current[title]
+
         params = {
             "action": "query",
-            "prop": "revisions",
+            "prop": "info|revisions",
             "titles": title,
-            "rvprop": "content",
+            "rvprop": "ids|content",
             "rvslots": "main",
             "format": "json",
+            "formatversion": "2",
         }
 
         try:
-            response = self.session.get(self.api_url, params=params)
+            response = self.session.get(
+                self.api_url, params=params, headers=headers or None
+            )
             response.raise_for_status()
-            data = response.json()
+            if response.status_code == 304:
+                logger.debug("Page '%s' not modified, using cached content", title)
+                self.cache.set(self._cache_key(title), stale)
+                return stale["content"]
+            data = parse_json(response)
+
+            # Log the full response for debugging; skip the dump unless shown
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API Response: %s", dump_json(data))
 
-            # Log the full response for debugging
-            logger.debug(f"API Response: {json.dumps(data, indent=2)}")
+            # Errors such as readapidenied are raised, so the caller may log in
+            _raise_for_api_error(data)
 
             # Check if response contains expected structure
             if "query" not in data:
@@ -161,20 +633,212 @@ class MediaWikiPageService(PageService):
 
             # Extract page content from response
             pages = data["query"]["pages"]
-            page_id = next(iter(pages))
+            page = pages[0]
 
             # Check if page exists
-            if "missing" in pages[page_id]:
+            if "missing" in page:
                 logger.warning(f"Page '{title}' does not exist")
+                self._store_missing(title)
                 return None
 
-            content = pages[page_id]["revisions"][0]["slots"]["main"]["*"]
+            content = page["revisions"][0]["slots"]["main"]["content"]
+            self._store(title, page, content, response.headers)
             return content
 
+        except MediaWikiApiError:
+            raise  # Logged by the client once it gives up
         except Exception as e:
             logger.error(f"Error retrieving page '{title}': {e}")
             raise
 
+    def get_pages_batch(self, titles: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Retrieve the content of several wiki pages.
+        Titles are sent up to titles_per_request at a time as one query.
+
+        Args:
+            titles: Titles of the pages to retrieve
+
+        Returns:
+            Dict[str, Optional[str]]: Wikitext per requested title, None if missing
+        """
+        results = {}
+        to_fetch = []
+        stale = {}
+        for title in dict.fromkeys(titles):
+            cached = None
+            if self.cache is not None:
+                key = self._cache_key(title)
+                if not self.refresh:
+                    cached = self.cache.get(key)
+                if cached is None:
+                    entry = self.cache.get(key, allow_expired=True)
+                    if entry is not None and entry["revid"] is not None:
+                        stale[title] = entry
+            if cached is not None:
+                results[title] = cached["content"]
+            else:
+                to_fetch.append(title)
+
+        # Keep expired pages whose revision has not changed
+        if stale:
+            results.update(self._revalidate(stale))
+            to_fetch = [title for title in to_fetch if title not in results]
+
+        for chunk in _chunked(to_fetch, self.titles_per_request):
+            params = {
+                "action": "query",
+                "prop": "info|revisions",
+                "titles": "|".join(chunk),
+                "rvprop": "ids|content",
+                "rvslots": "main",
+                "format": "json",
+                "formatversion": "2",
+            }
+
+            contents = {}
+            infos = {}
+            aliases = {}
+            try:
+                # Large pages may not all fit into one response
+                while True:
+                    # POST, since hundreds of titles overflow URL length limits
+                    response = self.session.post(self.api_url, data=params)
+                    response.raise_for_status()
+                    data = parse_json(response)
+                    _raise_for_api_error(data)
+
+                    if "query" not in data:
+                        logger.error(f"Unexpected API response structure: {data}")
+                        break
+
+                    query = data["query"]
+                    aliases.update(_title_aliases(query))
+                    for page in query.get("pages", []):
+                        if "missing" in page or "invalid" in page:
+                            contents.setdefault(page["title"], None)
+                        elif "revisions" in page:
+                            infos[page["title"]] = page
+                            slots = page["revisions"][0]["slots"]
+                            contents[page["title"]] = slots["main"]["content"]
+
+                    if "continue" not in data:
+                        break
+                    params.update(data["continue"])
+
+            except MediaWikiApiError:
+                raise  # Logged by the client once it gives up
+            except Exception as e:
+                logger.error(f"Error retrieving pages {chunk}: {e}")
+                raise
+
+            for title in chunk:
+                resolved = _resolve_title(title, aliases)
+                results[title] = contents.get(resolved)
+                if results[title] is not None:
+                    self._store(title, infos[resolved], results[title])
+                elif resolved in contents:
+                    self._store_missing(title)
+
+        return results
+
+    def _revalidate(self, stale: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Check expired cache entries against the pages' latest revisions.
+        Asks only for page info, so unchanged pages are not downloaded again.
+
+        Args:
+            stale: Expired cache entries per title
+
+        Returns:
+            Dict[str, str]: Cached content of the titles that are unchanged;
+                their cache entries are renewed
+        """
+        current = {}
+        for chunk in _chunked(list(stale), self.titles_per_request):
+            params = {
+                "action": "query",
+                "prop": "info",
+                "titles": "|".join(chunk),
+                "format": "json",
+                "formatversion": "2",
+            }
+            try:
+                # POST, since hundreds of titles overflow URL length limits
+                response = self.session.post(self.api_url, data=params)
+                response.raise_for_status()
+                data = parse_json(response)
+                _raise_for_api_error(data)
+                query = data["query"]
+            except MediaWikiApiError:
+                raise
+            except Exception as e:
+                logger.warning(f"Could not revalidate pages {chunk}: {e}")
+                continue
+
+            aliases = _title_aliases(query)
+            revids = {
+                page["title"]: page.get("lastrevid") for page in query.get("pages", [])
+            }
+            for title in chunk:
+                entry = stale[title]
+                if revids.get(_resolve_title(title, aliases)) == entry["revid"]:
+                    self.cache.set(self._cache_key(title), entry)
+                    current[title] = entry["content"]
+        return current
+
+    def _cache_key(self, title: str) -> str:
+        """
+        Build the cache key for a page's content.
+
+        Args:
+            title: Title of the page
+
+        Returns:
+            str: Cache key
+        """
+        return PageCache.make_key("page", self.api_url, title)
+
+    def _store(
+        self,
+        title: str,
+        page: Dict[str, Any],
+        content: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Cache page content together with its revision id.
+
+        Args:
+            title: Title the page was requested as
+            page: Page entry of the API response
+            content: Wikitext of the page
+            headers: Response headers; their validators enable conditional GETs
+        """
+        if self.cache is None:
+            return
+        revid = page.get("lastrevid") or page["revisions"][0].get("revid")
+        entry = {"revid": revid, "content": content}
+        if headers is not None:
+            entry["etag"] = headers.get("ETag")
+            entry["last_modified"] = headers.get("Last-Modified")
+        self.cache.set(self._cache_key(title), entry)
+
+    def _store_missing(self, title: str) -> None:
+        """
+        Remember that a page does not exist, so repeated lookups skip the API.
+
+        Args:
+            title: Title the page was requested as
+        """
+        if self.cache is None:
+            return
+        self.cache.set(
+            self._cache_key(title),
+            {"revid": None, "content": None},
+            expire=MISSING_PAGE_TTL,
+        )
+
     def edit_page(self, title: str, content: str, summary: str = "", **options) -> bool:
         """
         Edit or create a wiki page with new content.
@@ -193,14 +857,10 @@ class MediaWikiPageService(PageService):
             if not self.auth_service.login():
                 raise Exception("Authentication required to edit pages")
 
-        # Step 1: Get CSRF token
-        params = {"action": "query", "meta": "tokens", "format": "json"}
-
         try:
-            response = self.session.get(self.api_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            csrf_token = data["query"]["tokens"]["csrftoken"]
+            # Step 1: Get a CSRF token; it stays valid for the whole session
+            if self._csrf_token is None:
+                self._csrf_token = self._fetch_csrf_token()
 
             # Step 2: Submit the edit
             edit_params = {
@@ -208,8 +868,9 @@ class MediaWikiPageService(PageService):
                 "title": title,
                 "text": content,
                 "summary": summary,
-                "token": csrf_token,
+                "token": self._csrf_token,
                 "format": "json",
+                "formatversion": "2",
             }
 
             # Add optional parameters
@@ -220,19 +881,48 @@ class MediaWikiPageService(PageService):
 
             edit_response = self.session.post(self.api_url, data=edit_params)
             edit_response.raise_for_status()
-            edit_data = edit_response.json()
+            edit_data = parse_json(edit_response)
+
+            # The session was renewed (e.g. by a new login); retry once
+            if edit_data.get("error", {}).get("code") == "badtoken":
+                logger.debug("CSRF token expired, fetching a new one")
+                self._csrf_token = edit_params["token"] = self._fetch_csrf_token()
+                edit_response = self.session.post(self.api_url, data=edit_params)
+                edit_response.raise_for_status()
+                edit_data = parse_json(edit_response)
 
             if "error" in edit_data:
                 logger.error(f"Edit failed: {edit_data['error']['info']}")
                 return False
 
-            logger.debug(f"Successfully edited page '{title}'")
+            logger.debug("Successfully edited page '%s'", title)
+            if self.cache is not None:
+                # Drop stale content and links of the edited page
+                self.cache.delete(self._cache_key(title))
+                self.cache.delete(PageCache.make_key("links", self.api_url, title))
             return True
 
         except Exception as e:
             logger.error(f"Error editing page '{title}': {e}")
             raise
 
+    def _fetch_csrf_token(self) -> str:
+        """
+        Request a CSRF token for editing.
+
+        Returns:
+            str: Token for the current session
+        """
+        params = {
+            "action": "query",
+            "meta": "tokens",
+            "format": "json",
+            "formatversion": "2",
+        }
+        response = self.session.get(self.api_url, params=params)
+        response.raise_for_status()
+        return parse_json(response)["query"]["tokens"]["csrftoken"]
+
 
 class MediaWikiLinkService(LinkService):
     """
@@ -240,18 +930,27 @@ class MediaWikiLinkService(LinkService):
     Handles retrieving links from pages.
     """
 
-    def __init__(self, api_url: str, session=None):
+    def __init__(
+        self,
+        api_url: str,
+        session=None,
+        cache: Optional[PageCache] = None,
+        refresh: bool = False,
+    ):
         """
         Initialize the link service.
 
         Args:
             api_url: URL of the MediaWiki API endpoint
             session: Optional requests session to use
+            cache: Optional persistent cache for page links
+            refresh: Ignore cached links and fetch them again
         """
         self.api_url = api_url
-        self.session = session or requests.Session()
-        if not session:
-            self.session.headers.update({"User-Agent": "PyWikiCLI/0.1"})
+        self.cache = cache
+        self.titles_per_request = MAX_TITLES_PER_REQUEST
+        self.refresh = refresh
+        self.session = session or create_session()
 
     def get_links(self, title: str) -> List[str]:
         """
@@ -263,48 +962,208 @@ class MediaWikiLinkService(LinkService):
         Returns:
             List[str]: List of page titles linked from the page
         """
+        return list(self.iter_links(title))
+
+    def iter_links(self, title: str) -> Iterator[str]:
+        """
+        Iterate over the links from a wiki page as they arrive.
+        Links of each continuation response are yielded before the next
+        one is requested.
+
+        Args:
+            title: Title of the page to get links from
+
+        Yields:
+            str: Titles of the pages linked from the page
+        """
+        if self.cache is not None and not self.refresh:
+            cached = self.cache.get(self._cache_key(title))
+            if cached is not None:
+                yield from cached
+                return
+
         params = {
             "action": "query",
             "prop": "links",
             "titles": title,
             "pllimit": 500,  # Fetch up to 500 links
             "format": "json",
+            "formatversion": "2",
         }
 
-        all_links = []
+        # Only keep every link around when it has to be cached at the end
+        all_links = [] if self.cache is not None else None
         try:
             # Handle continuation if there are many links
-            continue_param = None
-
             while True:
-                if continue_param:
-                    params.update(continue_param)
-
                 response = self.session.get(self.api_url, params=params)
                 response.raise_for_status()
-                data = response.json()
+                data = parse_json(response)
+                _raise_for_api_error(data)
 
                 # Extract links from response
                 pages = data["query"]["pages"]
-                page_id = next(iter(pages))
+                page = pages[0]
 
                 # Check if page exists and has links
-                if "missing" not in pages[page_id] and "links" in pages[page_id]:
-                    links = pages[page_id]["links"]
-                    all_links.extend([link["title"] for link in links])
+                if "missing" not in page and "links" in page:
+                    links = [link["title"] for link in page["links"]]
+                    if all_links is not None:
+                        all_links.extend(links)
+                    yield from links
 
                 # Check if we need to continue for more links
                 if "continue" not in data:
                     break
 
-                continue_param = {"plcontinue": data["continue"]["plcontinue"]}
-
-            return all_links
+                params["plcontinue"] = data["continue"]["plcontinue"]
 
+        except MediaWikiApiError:
+            raise  # Logged by the client once it gives up
         except Exception as e:
             logger.error(f"Error retrieving links from '{title}': {e}")
             raise
 
+        if all_links is not None:
+            self.cache.set(self._cache_key(title), all_links)
+
+    def walk_from(self, title: str) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Iterate over the pages linked from a page together with their content.
+        Uses generator=links, so links and content arrive in the same
+        requests instead of one query for the links and more for the pages.
+
+        Args:
+            title: Title of the page to start from
+
+        Yields:
+            Tuple[str, Optional[str]]: (title, content) of each linked page,
+            with content None for missing pages
+        """
+        params = {
+            "action": "query",
+            "generator": "links",
+            "titles": title,
+            "gpllimit": self.titles_per_request,
+            "prop": "revisions",
+            "rvprop": "content",
+            "rvslots": "main",
+            "format": "json",
+            "formatversion": "2",
+        }
+
+        # Content of a generated batch may be spread over several
+        # continuation responses; pages without it yet come again later
+        seen = set()
+        try:
+            while True:
+                response = self.session.get(self.api_url, params=params)
+                response.raise_for_status()
+                data = parse_json(response)
+                _raise_for_api_error(data)
+
+                for page in data.get("query", {}).get("pages", []):
+                    page_title = page["title"]
+                    if page_title in seen:
+                        continue
+                    if "missing" in page or "invalid" in page:
+                        seen.add(page_title)
+                        yield page_title, None
+                    elif "revisions" in page:
+                        seen.add(page_title)
+                        slots = page["revisions"][0]["slots"]
+                        yield page_title, slots["main"]["content"]
+
+                if "continue" not in data:
+                    break
+                params.update(data["continue"])
+
+        except MediaWikiApiError:
+            raise  # Logged by the client once it gives up
+        except Exception as e:
+            logger.error(f"Error walking links from '{title}': {e}")
+            raise
+
+    def get_links_batch(self, titles: List[str]) -> Dict[str, List[str]]:
+        """
+        Get all links from several wiki pages.
+        Titles are sent up to titles_per_request at a time as one query.
+
+        Args:
+            titles: Titles of the pages to get links from
+
+        Returns:
+            Dict[str, List[str]]: Linked page titles per requested title
+        """
+        results = {}
+        to_fetch = []
+        for title in dict.fromkeys(titles):
+            cached = None
+            if self.cache is not None and not self.refresh:
+                cached = self.cache.get(self._cache_key(title))
+            if cached is not None:
+                results[title] = cached
+            else:
+                to_fetch.append(title)
+
+        for chunk in _chunked(to_fetch, self.titles_per_request):
+            params = {
+                "action": "query",
+                "prop": "links",
+                "titles": "|".join(chunk),
+                "pllimit": 500,  # Shared across all titles of the request
+                "format": "json",
+                "formatversion": "2",
+            }
+
+            links_by_title = {}
+            aliases = {}
+            try:
+                # Handle continuation if there are many links
+                while True:
+                    # POST, since hundreds of titles overflow URL length limits
+                    response = self.session.post(self.api_url, data=params)
+                    response.raise_for_status()
+                    data = parse_json(response)
+                    _raise_for_api_error(data)
+
+                    query = data["query"]
+                    aliases.update(_title_aliases(query))
+                    for page in query["pages"]:
+                        page_links = links_by_title.setdefault(page["title"], [])
+                        page_links.extend(
+                            link["title"] for link in page.get("links", [])
+                        )
+
+                    if "continue" not in data:
+                        break
+                    params.update(data["continue"])
+
+            except MediaWikiApiError:
+                raise  # Logged by the client once it gives up
+            except Exception as e:
+                logger.error(f"Error retrieving links from {chunk}: {e}")
+                raise
+
+            for title in chunk:
+                results[title] = links_by_title.get(_resolve_title(title, aliases), [])
+                if self.cache is not None:
+                    self.cache.set(self._cache_key(title), results[title])
+
+        return results
+
+    def _cache_key(self, title: str) -> str:
+        """
+        Build the cache key for a page's links.
+
+        Args:
+            title: Title of the page
+
+        Returns:
+            str: Cache key
+        """
+        return PageCache.make_key("links", self.api_url, title)
+
 
 class MediaWikiUrlGenerator(UrlGenerator):
     """
@@ -320,6 +1179,13 @@ class MediaWikiUrlGenerator(UrlGenerator):
         """
         self.api_url = api_url
 
+        # Most MediaWiki sites follow these patterns:
+        # API: https://wiki.example.com/api.php
+        # Page: https://wiki.example.com/wiki/Page_Name or https://wiki.example.com/index.php?title=Page_Name
+        # The base URL never changes, so derive it once
+        self.base_url = api_url.split("/api.php")[0]
+        self._page_prefix = f"{self.base_url}/wiki/"
+
     def get_page_url(self, page_title: str) -> str:
         """
         Generate URL to a wiki page.
@@ -330,18 +1196,12 @@ class MediaWikiUrlGenerator(UrlGenerator):
         Returns:
             str: URL to the wiki page
         """
-        # Most MediaWiki sites follow these patterns:
-        # API: https://wiki.example.com/api.php
-        # Page: https://wiki.example.com/wiki/Page_Name or https://wiki.example.com/index.php?title=Page_Name
+        # Use the /wiki/ pattern which is common
+        return self._page_prefix + _title_to_url_path(page_title)
 
-        # Try to determine the base URL
-        base_url = self.api_url.split("/api.php")[0]
 
-        # Encode the page name for URLs
-        encoded_page = urllib.parse.quote(page_title.replace(" ", "_"))
-
-        # First try the /wiki/ pattern which is common
-        return f"{base_url}/wiki/{encoded_page}"
+# Marks an iterator that ended before yielding anything
+_EXHAUSTED = object()
 
 
 class MediaWikiClient(WikiApiInterface):
@@ -350,7 +1210,17 @@ class MediaWikiClient(WikiApiInterface):
     Implements the Facade pattern to provide a unified interface to all services.
     """
 
-    def __init__(self, api_url: str, username: str = None, password: str = None):
+    def __init__(
+        self,
+        api_url: str,
+        username: str = None,
+        password: str = None,
+        cache: Optional[PageCache] = None,
+        rate_limit: Optional[float] = DEFAULT_RATE_LIMIT,
+        pool_maxsize: int = POOL_MAXSIZE,
+        refresh: bool = False,
+        cookie_path: Optional[str] = None,
+    ):
         """
         Initialize the MediaWiki client.
 
@@ -358,16 +1228,29 @@ class MediaWikiClient(WikiApiInterface):
             api_url: URL of the MediaWiki API endpoint
             username: Username for authentication
             password: Password for authentication
+            cache: Optional persistent cache for page content and links
+            rate_limit: Maximum requests per minute, None or 0 for unlimited
+            pool_maxsize: Connections kept alive, at least the number of
+                threads using the client at once
+            refresh: Check cached pages against the wiki even if not expired
+            cookie_path: Optional file keeping the login between runs
         """
         self.api_url = api_url
-        self.auth_service = MediaWikiAuth(api_url, username, password)
-        self.page_service = MediaWikiPageService(api_url, self.auth_service)
-        self.link_service = MediaWikiLinkService(api_url, self.auth_service.session)
+        self.auth_service = MediaWikiAuth(
+            api_url,
+            username,
+            password,
+            create_session(rate_limit, pool_maxsize),
+            cookie_path,
+        )
+        self.page_service = MediaWikiPageService(
+            api_url, self.auth_service, cache, refresh
+        )
+        self.link_service = MediaWikiLinkService(
+            api_url, self.auth_service.session, cache, refresh
+        )
         self.url_generator = MediaWikiUrlGenerator(api_url)
-
-        # Try to login if credentials are provided
-        if username and password:
-            self.login()
+        # Login is deferred until a request needs it, see ensure_logged_in
 
     def login(self) -> bool:
         """
@@ -376,7 +1259,103 @@ class MediaWikiClient(WikiApiInterface):
         Returns:
             bool: True if login successful, False otherwise
         """
-        return self.auth_service.login()
+        if not self.auth_service.login():
+            return False
+        # Accounts with apihighlimits may batch more titles per query
+        limit = self.auth_service.titles_per_request
+        self.page_service.titles_per_request = limit
+        self.link_service.titles_per_request = limit
+        return True
+
+    def ensure_logged_in(self) -> bool:
+        """
+        Log in unless the client is already authenticated.
+
+        Returns:
+            bool: True if authenticated, False otherwise
+        """
+        if self.auth_service.is_authenticated():
+            return True
+        return self.login()
+
+    def _read(self, method, *args):
+        """
+        Call a read method anonymously, logging in and retrying once if the
+        wiki denies anonymous reads.
+
+        Args:
+            method: Service method performing the request
+            *args: Arguments for the method
+
+        Returns:
+            Any: Result of the method
+        """
+        for attempt in range(2):
+            try:
+                return method(*args)
+            except MediaWikiApiError as e:
+                if attempt == 0 and self._log_in_after_denial(e):
+                    logger.debug("Retrying %s after logging in", method.__name__)
+                    continue
+                logger.error(f"API request failed: {e}")
+                raise
+
+    def _read_iter(self, method, *args) -> Iterator[Any]:
+        """
+        Iterate over a streaming read anonymously, logging in and retrying
+        once if the wiki denies the first request. Denials after the first
+        item has been yielded are not retried, as items would repeat.
+
+        Args:
+            method: Service method returning an iterator
+            *args: Arguments for the method
+
+        Yields:
+            Any: Items of the iterator
+        """
+        for attempt in range(2):
+            items = method(*args)
+            try:
+                first = next(items, _EXHAUSTED)
+            except MediaWikiApiError as e:
+                if attempt == 0 and self._log_in_after_denial(e):
+                    logger.debug("Retrying %s after logging in", method.__name__)
+                    continue
+                logger.error(f"API request failed: {e}")
+                raise
+            if first is not _EXHAUSTED:
+                yield first
+                yield from items
+            return
+
+    def _log_in_after_denial(self, error: MediaWikiApiError) -> bool:
+        """
+        Log in if an anonymous read was denied and credentials are available.
+
+        Args:
+            error: Error raised by the read
+
+        Returns:
+            bool: True if the read should be retried, False otherwise
+        """
+        auth = self.auth_service
+        return bool(
+            error.code == "readapidenied"
+            and not auth.is_authenticated()
+            and auth.username
+            and auth.password
+            and self.ensure_logged_in()
+        )
+
+    @property
+    def titles_per_request(self) -> int:
+        """
+        Maximum number of titles sent per batched query.
+
+        Returns:
+            int: Title limit per request
+        """
+        return self.page_service.titles_per_request
 
     def is_authenticated(self) -> bool:
         """
@@ -397,7 +1376,19 @@ class MediaWikiClient(WikiApiInterface):
         Returns:
             Optional[str]: Page content or None if page doesn't exist
         """
-        return self.page_service.get_page(title)
+        return self._read(self.page_service.get_page, title)
+
+    def get_pages_batch(self, titles: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Retrieve content of several wiki pages with batched API requests.
+
+        Args:
+            titles: Titles of the wiki pages
+
+        Returns:
+            Dict[str, Optional[str]]: Content per requested title, None if missing
+        """
+        return self._read(self.page_service.get_pages_batch, titles)
 
     def edit_page(self, title: str, content: str, summary: str = "", **options) -> bool:
         """
@@ -412,6 +1403,8 @@ class MediaWikiClient(WikiApiInterface):
         Returns:
             bool: True if successful, False otherwise
         """
+        if not self.ensure_logged_in():
+            raise Exception("Authentication required to edit pages")
         return self.page_service.edit_page(title, content, summary, **options)
 
     def get_links(self, title: str) -> List[str]:
@@ -424,7 +1417,44 @@ class MediaWikiClient(WikiApiInterface):
         Returns:
             List[str]: List of page titles linked from the page
         """
-        return self.link_service.get_links(title)
+        return self._read(self.link_service.get_links, title)
+
+    def iter_links(self, title: str) -> Iterator[str]:
+        """
+        Iterate over the links from a wiki page as they arrive.
+
+        Args:
+            title: Title of the wiki page
+
+        Returns:
+            Iterator[str]: Titles of the pages linked from the page
+        """
+        return self._read_iter(self.link_service.iter_links, title)
+
+    def get_links_batch(self, titles: List[str]) -> Dict[str, List[str]]:
+        """
+        Get all links from several wiki pages with batched API requests.
+
+        Args:
+            titles: Titles of the wiki pages
+
+        Returns:
+            Dict[str, List[str]]: Linked page titles per requested title
+        """
+        return self._read(self.link_service.get_links_batch, titles)
+
+    def walk_from(self, title: str) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Iterate over the pages linked from a wiki page with their content.
+
+        Args:
+            title: Title of the wiki page
+
+        Returns:
+            Iterator[Tuple[str, Optional[str]]]: (title, content) of each
+            linked page, with content None for missing pages
+        """
+        return self._read_iter(self.link_service.walk_from, title)
 
     def get_page_url(self, page_title: str) -> str:
         """
@@ -438,6 +1468,20 @@ class MediaWikiClient(WikiApiInterface):
         """
         return self.url_generator.get_page_url(page_title)
 
+    def close(self) -> None:
+        """
+        Close the HTTP session and release its pooled connections.
+        """
+        # The server may have refreshed the session cookies meanwhile
+        self.auth_service.save_cookies()
+        self.auth_service.session.close()
+
+    def __enter__(self) -> "MediaWikiClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
 
 # For backward compatibility
 WikiClient = MediaWikiClient
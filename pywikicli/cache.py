@@ -0,0 +1,130 @@
+"""
+Persistent response cache for PyWikiCLI.
+Stores API results in a small SQLite database under ~/.cache/pywikicli/.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from pywikicli.jsonutil import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.expanduser("~/.cache/pywikicli")
+CACHE_PATH = os.path.join(CACHE_DIR, "cache.sqlite3")
+
+# Default lifetime of cached entries in seconds
+DEFAULT_CACHE_TTL = 3600
+
+# Lifetime of "page does not exist" entries; missing pages rarely appear
+MISSING_PAGE_TTL = 86400
+
+# Seconds expired entries are kept for revalidation before they are purged
+EXPIRED_GRACE_PERIOD = 7 * 86400
+
+
+class PageCache:
+    """
+    Key/value cache with per-entry expiry, persisted in SQLite.
+    Safe to share between the crawler's worker threads.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, ttl: Optional[int] = DEFAULT_CACHE_TTL):
+        """
+        Initialize the cache.
+        Entries expired for longer than EXPIRED_GRACE_PERIOD are purged, so
+        the database does not keep every page ever fetched.
+
+        Args:
+            path: Path of the SQLite database file
+            ttl: Default lifetime of entries in seconds, None for no expiry
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL)"
+        )
+        self._conn.execute(
+            "DELETE FROM cache WHERE expires < ?",
+            (time.time() - EXPIRED_GRACE_PERIOD,),
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """
+        Build a cache key from its parts.
+
+        Args:
+            *parts: Values identifying the entry (e.g. kind, API URL, title)
+
+        Returns:
+            str: Hex digest identifying the entry
+        """
+        return hashlib.blake2b("|".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str, default: Any = None, allow_expired: bool = False) -> Any:
+        """
+        Look up an entry.
+
+        Args:
+            key: Cache key
+            default: Value returned when the entry is missing or expired
+            allow_expired: Also return expired entries, e.g. for revalidation
+
+        Returns:
+            Any: Cached value or default
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return default
+        value, expires = row
+        if not allow_expired and expires is not None and expires < time.time():
+            return default
+        return loads(value)
+
+    def set(self, key: str, value: Any, expire: Optional[int] = None) -> None:
+        """
+        Store an entry.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            expire: Lifetime in seconds, defaults to the cache TTL
+        """
+        ttl = self.ttl if expire is None else expire
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                (key, dumps(value), expires),
+            )
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        """
+        Remove an entry if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
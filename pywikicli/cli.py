@@ -4,11 +4,47 @@ Defines the main command group and registers subcommands.
 """
 
 import click
+import importlib
 import logging
 from pywikicli.config import load_config
 
 
-@click.group(help="PyWikiCLI - interact with a MediaWiki via its API")
+class LazyGroup(click.Group):
+    """
+    Command group that imports subcommand modules only when they are invoked.
+    Keeps startup fast, since e.g. 'config' never needs the HTTP stack.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        """
+        Initialize the group.
+
+        Args:
+            lazy_subcommands: Map of command name to "module:attribute" path
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+            return getattr(importlib.import_module(module_name), attr)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "get": "pywikicli.commands.get_command:get_command",
+        "put": "pywikicli.commands.put_command:put_command",
+        "crawl": "pywikicli.commands.crawl_command:crawl_command",
+        "config": "pywikicli.commands.config_command:config_command",
+    },
+    help="PyWikiCLI - interact with a MediaWiki via its API",
+)
 @click.option("--debug/--no-debug", default=False, help="Enable debug output")
 @click.pass_context
 def cli(ctx, debug):
@@ -22,16 +58,5 @@ def cli(ctx, debug):
     ctx.obj["config"] = load_config()
 
 
-# Import and register subcommands
-from pywikicli.commands.get_command import get_command
-from pywikicli.commands.put_command import put_command
-from pywikicli.commands.crawl_command import crawl_command
-from pywikicli.commands.config_command import config_command
-
-cli.add_command(get_command)
-cli.add_command(put_command)
-cli.add_command(crawl_command)
-cli.add_command(config_command)
-
 if __name__ == "__main__":
     cli()
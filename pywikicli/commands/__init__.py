@@ -3,3 +3,44 @@ Command modules for the PyWikiCLI.
 """
 
 # This package contains the implementation of all CLI commands
+
+import click
+
+# Characters in page titles that cannot appear in file names on common
+# file systems; one translate pass replaces them all
+SAFE_NAME_TABLE = str.maketrans(dict.fromkeys(' /\\:*?"<>|', "_"))
+
+
+def get_client(ctx: click.Context, **options):
+    """
+    Get the wiki client shared by the commands of one CLI invocation.
+    The client is created from the loaded configuration on first use and
+    closed together with the root context.
+
+    Args:
+        ctx: Click context of the running command
+        **options: Additional client options (e.g. cache), used when the
+            client is created
+
+    Returns:
+        MediaWikiClient: Client for the configured wiki
+    """
+    # Imported here so commands that never talk to the wiki skip the HTTP stack
+    from pywikicli.api import DEFAULT_RATE_LIMIT, WikiClient
+    from pywikicli.config import COOKIE_PATH
+
+    root = ctx.find_root()
+    obj = root.ensure_object(dict)
+    if "client" not in obj:
+        cfg = obj.get("config", {})
+        client = WikiClient(
+            cfg["api_url"],
+            cfg.get("username"),
+            cfg.get("password"),
+            rate_limit=cfg.get("rate_limit", DEFAULT_RATE_LIMIT),
+            cookie_path=COOKIE_PATH,
+            **options,
+        )
+        root.call_on_close(client.close)
+        obj["client"] = client
+    return obj["client"]
@@ -6,12 +6,36 @@ This command manages PyWikiCLI configuration settings.
 import click
 import yaml
 import logging
-from pywikicli.config import load_config, save_config, CONFIG_PATH
+from pywikicli.config import save_config, CONFIG_PATH
 
 logger = logging.getLogger(__name__)
 
 
+def show_config(ctx, param, value):
+    """
+    Print the current configuration and exit.
+    Eager option callback, so it runs before any value is prompted for.
+    """
+    if not value or ctx.resilient_parsing:
+        return
+    # The CLI group already loaded the configuration
+    display = dict(ctx.obj["config"])
+    if "password" in display:
+        display["password"] = "********"  # Mask password
+    click.echo("Current configuration:")
+    click.echo(yaml.safe_dump(display, default_flow_style=False))
+    ctx.exit()
+
+
 @click.command("config")
+@click.option(
+    "--show",
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=show_config,
+    help="Show the current configuration and exit",
+)
 @click.option(
     "--api-url", prompt="MediaWiki API URL", help="URL of the MediaWiki API endpoint"
 )
@@ -23,38 +47,18 @@ logger = logging.getLogger(__name__)
     confirmation_prompt=True,
     help="Your wiki password",
 )
-def config_command(api_url, username, password):
+@click.pass_context
+def config_command(ctx, api_url, username, password):
     """
     Configure connection settings for the wiki.
 
     Examples:
       wikibot config --api-url "https://example.com/w/api.php" --username "user" --password "pass"
       wikibot config
+      wikibot config --show
     """
-    # Load current configuration
-    current = load_config()
-
-    # Show current configuration if requested
-    if not any([api_url, username, password]):
-        display = current.copy()
-        if "password" in display:
-            display["password"] = "********"  # Mask password
-        click.echo("Current configuration:")
-        click.echo(yaml.safe_dump(display, default_flow_style=False))
-        return
-
-    # If no options specified, prompt for values interactively
-    if not any([api_url, username, password]):
-        click.echo("Enter configuration values (press Enter to keep current value):")
-        api_url = click.prompt("Wiki API URL", default=current.get("api_url", ""))
-        username = click.prompt("Username", default=current.get("username", ""))
-        pwd = click.prompt(
-            "Password (hidden)", hide_input=True, default="", show_default=False
-        )
-        password = pwd or current.get("password", "")
-
-    # Update configuration with new values
-    new_cfg = current.copy()
+    # Merge into the current configuration to keep settings not managed here
+    new_cfg = dict(ctx.obj["config"])
     if api_url:
         new_cfg["api_url"] = api_url
     if username:
@@ -66,6 +70,7 @@ def config_command(api_url, username, password):
     save_config(new_cfg)
     click.echo(f"Configuration saved to {CONFIG_PATH}")
     logger.debug(
-        f"Configuration updated with API URL: {new_cfg.get('api_url')}, "
-        f"Username: {new_cfg.get('username')}"
+        "Configuration updated with API URL: %s, Username: %s",
+        new_cfg.get("api_url"),
+        new_cfg.get("username"),
     )
@@ -7,13 +7,101 @@ import click
 import os
 import logging
 from collections import deque
-from typing import List, Set, Tuple, Dict, Optional, Callable
-
-from pywikicli.api import WikiClient
+from functools import lru_cache, partial
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, List, Set, Tuple, Dict, Optional, Callable
+
+from pywikicli.api import (
+    WikiClient,
+    DEFAULT_RATE_LIMIT,
+    MAX_TITLES_PER_REQUEST,
+    POOL_MAXSIZE,
+)
+from pywikicli.cache import PageCache, DEFAULT_CACHE_TTL
+from pywikicli.commands import SAFE_NAME_TABLE
+from pywikicli.config import COOKIE_PATH
 from pywikicli.interfaces import WikiApiInterface
+from pywikicli.wikitext import extract_links
 
 logger = logging.getLogger(__name__)
 
+# Number of characters of each page shown by the console output
+CONSOLE_PREVIEW_LENGTH = 500
+
+
+@lru_cache(maxsize=65536)
+def _title_to_filename(page_title: str) -> str:
+    """
+    Map a page title to the file name it is saved under.
+    Memoized, since the same titles recur across crawls in one process.
+
+    Args:
+        page_title: Title of the page
+
+    Returns:
+        str: File name for the page
+    """
+    return page_title.translate(SAFE_NAME_TABLE) + ".txt"
+
+
+class PageQueue:
+    """
+    Queue of pages to crawl, stored as parallel deques of titles and depths.
+    Avoids allocating a (title, depth) tuple per queued page; depths are small
+    ints shared by the interpreter. Supports the deque operations strategies use.
+    """
+
+    __slots__ = ("titles", "depths")
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self.titles = deque()
+        self.depths = deque()
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def append(self, item: Tuple[str, int]) -> None:
+        """
+        Add a page to the right end of the queue.
+
+        Args:
+            item: Tuple of page title and depth
+        """
+        page, depth = item
+        self.titles.append(page)
+        self.depths.append(depth)
+
+    def extend(self, pages: List[str], depth: int) -> None:
+        """
+        Add several pages of the same depth to the right end of the queue.
+
+        Args:
+            pages: Page titles to add
+            depth: Depth of the pages
+        """
+        self.titles.extend(pages)
+        self.depths.extend(repeat(depth, len(pages)))
+
+    def popleft(self) -> Tuple[str, int]:
+        """
+        Remove and return the page at the left end of the queue.
+
+        Returns:
+            Tuple containing page and depth
+        """
+        return self.titles.popleft(), self.depths.popleft()
+
+    def pop(self) -> Tuple[str, int]:
+        """
+        Remove and return the page at the right end of the queue.
+
+        Returns:
+            Tuple containing page and depth
+        """
+        return self.titles.pop(), self.depths.pop()
+
 
 class CrawlStrategy:
     """
@@ -46,6 +134,32 @@ class CrawlStrategy:
         """
         raise NotImplementedError("Strategy must implement add_page")
 
+    @classmethod
+    def bind(cls, queue):
+        """
+        Bind get_next to a queue once, for use inside the crawl loop.
+
+        Args:
+            queue: Queue of pages to process
+
+        Returns:
+            Callable taking no arguments that returns the next (page, depth)
+        """
+        return partial(cls.get_next, queue)
+
+    @classmethod
+    def add_pages(cls, queue, pages, depth):
+        """
+        Add several pages of the same depth to the queue, in order.
+
+        Args:
+            queue: Queue of pages to process
+            pages: Pages to add
+            depth: Depth of the pages
+        """
+        for page in pages:
+            cls.add_page(queue, page, depth)
+
 
 class BreadthFirstStrategy(CrawlStrategy):
     """
@@ -66,6 +180,19 @@ class BreadthFirstStrategy(CrawlStrategy):
         """
         return queue.popleft()
 
+    @staticmethod
+    def bind(queue):
+        """
+        Bind to a queue, returning its popleft without any wrapper call.
+
+        Args:
+            queue: Queue of pages to process
+
+        Returns:
+            Callable taking no arguments that returns the next (page, depth)
+        """
+        return queue.popleft
+
     @staticmethod
     def add_page(queue, page, depth):
         """
@@ -78,6 +205,18 @@ class BreadthFirstStrategy(CrawlStrategy):
         """
         queue.append((page, depth))
 
+    @staticmethod
+    def add_pages(queue, pages, depth):
+        """
+        Add several pages to the end of the queue in a single C-level extend.
+
+        Args:
+            queue: Queue of pages to process
+            pages: Pages to add
+            depth: Depth of the pages
+        """
+        queue.extend(pages, depth)
+
 
 class DepthFirstStrategy(CrawlStrategy):
     """
@@ -98,6 +237,19 @@ class DepthFirstStrategy(CrawlStrategy):
         """
         return queue.pop()
 
+    @staticmethod
+    def bind(queue):
+        """
+        Bind to a queue, returning its pop without any wrapper call.
+
+        Args:
+            queue: Queue of pages to process
+
+        Returns:
+            Callable taking no arguments that returns the next (page, depth)
+        """
+        return queue.pop
+
     @staticmethod
     def add_page(queue, page, depth):
         """
@@ -110,6 +262,18 @@ class DepthFirstStrategy(CrawlStrategy):
         """
         queue.append((page, depth))
 
+    @staticmethod
+    def add_pages(queue, pages, depth):
+        """
+        Add several pages to the end of the queue in a single C-level extend.
+
+        Args:
+            queue: Queue of pages to process
+            pages: Pages to add
+            depth: Depth of the pages
+        """
+        queue.extend(pages, depth)
+
 
 class PageProcessor:
     """
@@ -127,37 +291,100 @@ class PageProcessor:
         """
         raise NotImplementedError("Processor must implement process")
 
+    def close(self) -> None:
+        """
+        Finish any outstanding work. Called by the crawler when a crawl ends.
+        """
+        pass
+
 
 class FileOutputProcessor(PageProcessor):
     """
     Processor that saves pages to files.
+    Writes happen on background threads so disk I/O overlaps with fetching.
     """
 
-    def __init__(self, output_dir: str):
+    def __init__(self, output_dir: str, max_workers: int = 4, max_pending: int = 256):
         """
         Initialize the processor.
 
         Args:
             output_dir: Directory to save files to
+            max_workers: Number of threads writing files
+            max_pending: Number of queued writes after which process blocks
+                until the oldest finished, bounding memory held by page content
         """
         self.output_dir = output_dir
+        # Directory prefix with trailing separator, so paths are a concatenation
+        self._out_prefix = os.path.join(output_dir, "")
+        self.max_workers = max_workers
+        self.max_pending = max(1, max_pending)
+        self._executor = None
+        self._writes = deque()
+        # Latest queued write per path; titles can map to the same file name
+        self._writes_by_path = {}
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
 
     def process(self, page_title: str, content: str) -> None:
         """
-        Save a page to a file.
+        Queue a page to be saved to a file.
+
+        Args:
+            page_title: Title of the page
+            content: Content of the page
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        safe_name = _title_to_filename(page_title)
+        path = self._out_prefix + safe_name
+        writes = self._writes
+        writes_by_path = self._writes_by_path
+        # Drop finished writes, waiting for the oldest if the disk falls behind
+        while writes and (writes[0][1].done() or len(writes) >= self.max_pending):
+            done_path, write = writes.popleft()
+            if writes_by_path.get(done_path) is write:
+                del writes_by_path[done_path]
+            write.result()
+        # Two workers writing one file could interleave; let the earlier
+        # page's write finish first, so the later page wins as it would in order
+        earlier = writes_by_path.get(path)
+        if earlier is not None:
+            logger.warning(
+                f"'{page_title}' overwrites {safe_name} saved for an earlier page"
+            )
+            earlier.result()
+        write = self._executor.submit(self._write, page_title, safe_name, path, content)
+        writes.append((path, write))
+        writes_by_path[path] = write
+
+    @staticmethod
+    def _write(page_title: str, safe_name: str, path: str, content: str) -> None:
+        """
+        Write a page to disk.
 
         Args:
             page_title: Title of the page
+            safe_name: File name of the page
+            path: Full path of the file
             content: Content of the page
         """
-        safe_name = page_title.replace(" ", "_").replace("/", "_") + ".txt"
-        path = os.path.join(self.output_dir, safe_name)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        with open(path, "wb") as f:
+            f.write(content.encode("utf-8"))
         logger.info(f"Saved '{page_title}' to {safe_name}")
 
+    def close(self) -> None:
+        """
+        Wait for queued writes to finish, re-raising the first write error.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        writes, self._writes = self._writes, deque()
+        self._writes_by_path = {}
+        for _, write in writes:
+            write.result()
+
 
 class ConsoleOutputProcessor(PageProcessor):
     """
@@ -172,9 +399,11 @@ class ConsoleOutputProcessor(PageProcessor):
             page_title: Title of the page
             content: Content of the page
         """
-        click.echo(f"\n=== Page: {page_title} ===")
         # Truncate long content for console display
-        click.echo(content[:500] + "..." if len(content) > 500 else content)
+        if len(content) > CONSOLE_PREVIEW_LENGTH:
+            content = content[:CONSOLE_PREVIEW_LENGTH] + "..."
+        # One write per page instead of one per line
+        click.echo(f"\n=== Page: {page_title} ===\n{content}")
 
 
 class WikiCrawlerService:
@@ -188,6 +417,10 @@ class WikiCrawlerService:
         wiki_client: WikiApiInterface,
         processor: PageProcessor,
         strategy: CrawlStrategy,
+        max_concurrent_requests: int = 10,
+        batch_size: int = 50,
+        visited_factory: Callable[[], Any] = set,
+        parse_links: bool = False,
     ):
         """
         Initialize the crawler service.
@@ -196,17 +429,73 @@ class WikiCrawlerService:
             wiki_client: Client for interacting with the wiki
             processor: Processor for handling crawled pages
             strategy: Strategy for traversing pages
+            max_concurrent_requests: Maximum number of batches fetched in parallel
+            batch_size: Maximum number of pages fetched per API request
+            visited_factory: Creates the container tracking discovered titles.
+                Any object supporting ``in`` and ``add`` works, e.g.
+                ``pybloom_live.ScalableBloomFilter`` to bound memory on huge
+                crawls at the cost of occasionally skipping a page.
+            parse_links: Extract links from the fetched wikitext instead of
+                asking the API; saves a request per batch but misses links
+                generated by templates
         """
         self.wiki_client = wiki_client
         self.processor = processor
         self.strategy = strategy
-        self.visited = set()
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        self.batch_size = max(1, batch_size)
+        self.visited_factory = visited_factory
+        self.parse_links = parse_links
+        self.visited = visited_factory()
         self.pages_processed = 0
+        self.pages_discovered = 0
+
+    def _fetch_batch(
+        self, batch: List[Tuple[str, int]], max_depth: int
+    ) -> List[Tuple[str, int, Optional[str], List[str]]]:
+        """
+        Fetch the content and links of a batch of pages.
+        Runs on a worker thread so several batches can be in flight at once.
+
+        Args:
+            batch: Pages to fetch as (page_title, depth) tuples
+            max_depth: Maximum link depth; links are only fetched below it
+
+        Returns:
+            List of (page_title, depth, content, links) in batch order,
+            with content None for missing pages
+        """
+        contents = self.wiki_client.get_pages_batch([page for page, _ in batch])
+
+        expand = [
+            page
+            for page, depth in batch
+            if depth < max_depth and contents.get(page) is not None
+        ]
+        links = {}
+        if expand and self.parse_links:
+            links = {page: extract_links(contents[page]) for page in expand}
+        elif expand:
+            try:
+                links = self.wiki_client.get_links_batch(expand)
+            except Exception as e:
+                logger.error(f"Error getting links from {expand}: {e}")
+
+        return [
+            (page, depth, contents.get(page), links.get(page, []))
+            for page, depth in batch
+        ]
 
     def crawl(self, start_page: str, max_depth: int, limit: int) -> Dict[str, int]:
         """
         Crawl the wiki starting from a page.
 
+        Queued pages are drained in batches of up to ``batch_size`` titles, each
+        fetched with one batched API request, and up to
+        ``max_concurrent_requests`` batches are in flight at once. Links of a
+        finished batch are queued and the next batches dispatched before its
+        pages are processed, so processing overlaps with fetching.
+
         Args:
             start_page: Page to start crawling from
             max_depth: Maximum link depth to crawl
@@ -215,41 +504,85 @@ class WikiCrawlerService:
         Returns:
             Statistics about the crawl
         """
-        self.visited = set([start_page])
-        queue = deque([(start_page, 0)])  # (page_title, depth)
+        self.visited = visited = self.visited_factory()
+        visited.add(start_page)
+        visited_add = visited.add
+        self.pages_discovered = 1
+        queue = PageQueue()
+        queue.append((start_page, 0))
         self.pages_processed = 0
-
-        while queue and self.pages_processed < limit:
-            # Get next page based on strategy
-            page, cur_depth = self.strategy.get_next(queue)
-
-            # Get page content
-            content = self.wiki_client.get_page(page)
-            if content is None:
-                logger.warning(f"Page '{page}' does not exist, skipping")
-                continue
-
-            self.pages_processed += 1
-
-            # Process the page
-            self.processor.process(page, content)
-
-            # Process links if we haven't reached max depth
-            if cur_depth < max_depth:
-                try:
-                    links = self.wiki_client.get_links(page)
-                    # Add new links to queue
-                    for link in links:
-                        if link not in self.visited:
-                            self.visited.add(link)
-                            self.strategy.add_page(queue, link, cur_depth + 1)
-                except Exception as e:
-                    logger.error(f"Error getting links from '{page}': {e}")
+        pending = {}  # Future -> number of pages in the batch
+        in_flight = 0
+
+        # Resolve strategy and processor methods once instead of per page
+        get_next = self.strategy.bind(queue)
+        add_pages = self.strategy.add_pages
+        process = self.processor.process
+        fetch_batch = self._fetch_batch
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            try:
+                ready = []  # (page_title, content) fetched but not yet processed
+                while (queue or pending) and self.pages_processed < limit:
+                    # Keep the pipeline full without fetching beyond the page limit
+                    while (
+                        queue
+                        and len(pending) < self.max_concurrent_requests
+                        and self.pages_processed + in_flight < limit
+                    ):
+                        size = min(
+                            self.batch_size,
+                            len(queue),
+                            limit - self.pages_processed - in_flight,
+                        )
+                        batch = [get_next() for _ in range(size)]
+                        future = executor.submit(fetch_batch, batch, max_depth)
+                        pending[future] = size
+                        in_flight += size
+
+                    # Process the previous round while the next one is fetched
+                    for page, content in ready:
+                        process(page, content)
+                    ready = []
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        in_flight -= pending.pop(future)
+                        for page, cur_depth, content, links in future.result():
+                            if content is None:
+                                logger.warning(
+                                    f"Page '{page}' does not exist, skipping"
+                                )
+                                continue
+
+                            if self.pages_processed >= limit:
+                                break
+                            self.pages_processed += 1
+                            ready.append((page, content))
+
+                            # Add new links to queue
+                            fresh = [
+                                link
+                                for link in dict.fromkeys(links)
+                                if link not in visited
+                            ]
+                            for link in fresh:
+                                visited_add(link)
+                            self.pages_discovered += len(fresh)
+                            add_pages(queue, fresh, cur_depth + 1)
+
+                for page, content in ready:
+                    process(page, content)
+            finally:
+                # Drop fetches that are no longer needed
+                for future in pending:
+                    future.cancel()
+                self.processor.close()
 
         # Return statistics
         return {
             "pages_processed": self.pages_processed,
-            "pages_discovered": len(self.visited),
+            "pages_discovered": self.pages_discovered,
         }
 
 
@@ -279,8 +612,55 @@ class WikiCrawlerService:
     show_default=True,
     help="Crawling strategy: bfs (breadth-first) or dfs (depth-first)",
 )
+@click.option(
+    "--concurrency",
+    "-j",
+    default=10,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of pages fetched in parallel",
+)
+@click.option(
+    "--rate-limit",
+    type=click.FloatRange(min=0),
+    help="Maximum API requests per minute, 0 for unlimited "
+    f"[default: rate_limit from the config or {DEFAULT_RATE_LIMIT}]",
+)
+@click.option(
+    "--no-cache", is_flag=True, help="Do not read or write the local page cache"
+)
+@click.option(
+    "--cache-ttl",
+    default=DEFAULT_CACHE_TTL,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Seconds a cached page stays valid",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Check cached pages against the wiki even if they have not expired",
+)
+@click.option(
+    "--parse-links",
+    is_flag=True,
+    help="Find links in the page text instead of querying the API (skips template links)",
+)
 @click.pass_context
-def crawl_command(ctx, start_page, depth, limit, output, strategy):
+def crawl_command(
+    ctx,
+    start_page,
+    depth,
+    limit,
+    output,
+    strategy,
+    concurrency,
+    rate_limit,
+    no_cache,
+    cache_ttl,
+    refresh,
+    parse_links,
+):
     """
     Crawl wiki pages starting from a given page, following links.
 
@@ -288,6 +668,11 @@ def crawl_command(ctx, start_page, depth, limit, output, strategy):
       wikibot crawl "Main Page"
       wikibot crawl "Main Page" --depth 2 --limit 50
       wikibot crawl "Main Page" -o file --strategy dfs
+      wikibot crawl "Main Page" --concurrency 4
+      wikibot crawl "Main Page" --rate-limit 30
+      wikibot crawl "Main Page" --no-cache
+      wikibot crawl "Main Page" --refresh
+      wikibot crawl "Main Page" --parse-links
     """
     # Get configuration
     cfg = ctx.obj["config"]
@@ -299,11 +684,6 @@ def crawl_command(ctx, start_page, depth, limit, output, strategy):
         )
         return
 
-    # Initialize client with credentials if available
-    client = WikiClient(
-        cfg["api_url"], username=cfg.get("username"), password=cfg.get("password")
-    )
-
     # Create appropriate processor
     if output == "file":
         output_dir = cfg.get("output_dir", ".")
@@ -318,26 +698,63 @@ def crawl_command(ctx, start_page, depth, limit, output, strategy):
     else:
         crawl_strategy = DepthFirstStrategy()
 
-    # Create and run crawler
-    crawler = WikiCrawlerService(client, processor, crawl_strategy)
-
-    click.echo(
-        f"Starting crawl from '{start_page}' with {strategy} strategy, max depth {depth}, limit {limit} pages"
-    )
+    # Cache pages locally so repeated crawls skip unchanged downloads
+    cache = None if no_cache else PageCache(ttl=cache_ttl)
 
-    try:
-        stats = crawler.crawl(start_page, depth, limit)
-
-        if stats["pages_processed"] >= limit:
-            click.echo(f"\nCrawl stopped after reaching limit of {limit} pages")
-        else:
-            click.echo(
-                f"\nCrawl complete. No more pages to process within depth {depth}"
-            )
+    # Initialize client with credentials if available
+    with WikiClient(
+        cfg["api_url"],
+        username=cfg.get("username"),
+        password=cfg.get("password"),
+        cache=cache,
+        rate_limit=(
+            rate_limit
+            if rate_limit is not None
+            else cfg.get("rate_limit", DEFAULT_RATE_LIMIT)
+        ),
+        pool_maxsize=max(POOL_MAXSIZE, concurrency),
+        refresh=refresh,
+        cookie_path=COOKIE_PATH,
+    ) as client:
+        # Bot accounts may query 500 titles at once; on crawls larger than
+        # one regular batch that saves more requests than the login costs
+        if (
+            limit > MAX_TITLES_PER_REQUEST
+            and cfg.get("username")
+            and cfg.get("password")
+        ):
+            client.ensure_logged_in()
+
+        # Create and run crawler
+        crawler = WikiCrawlerService(
+            client,
+            processor,
+            crawl_strategy,
+            max_concurrent_requests=concurrency,
+            batch_size=client.titles_per_request,
+            parse_links=parse_links,
+        )
 
-        click.echo(f"Total pages processed: {stats['pages_processed']}")
-        click.echo(f"Total pages discovered: {stats['pages_discovered']}")
+        click.echo(
+            f"Starting crawl from '{start_page}' with {strategy} strategy, max depth {depth}, limit {limit} pages"
+        )
 
-    except Exception as e:
-        click.echo(f"Error during crawl: {e}", err=True)
-        logger.debug(f"Detailed error: {str(e)}", exc_info=True)
+        try:
+            stats = crawler.crawl(start_page, depth, limit)
+
+            if stats["pages_processed"] >= limit:
+                click.echo(f"\nCrawl stopped after reaching limit of {limit} pages")
+            else:
+                click.echo(
+                    f"\nCrawl complete. No more pages to process within depth {depth}"
+                )
+
+            click.echo(f"Total pages processed: {stats['pages_processed']}")
+            click.echo(f"Total pages discovered: {stats['pages_discovered']}")
+
+        except Exception as e:
+            click.echo(f"Error during crawl: {e}", err=True)
+            logger.debug("Detailed error: %s", e, exc_info=True)
+        finally:
+            if cache is not None:
+                cache.close()
@@ -8,13 +8,23 @@ import os
 import sys
 from typing import Optional
 
-from pywikicli.api import WikiClient, MediaWikiClient
-from pywikicli.config import load_config
+from pywikicli.cache import PageCache
+from pywikicli.commands import SAFE_NAME_TABLE, get_client
 from pywikicli.interfaces import WikiApiInterface, UrlGenerator
-from pywikicli.converters import ContentConverterRegistry, infer_format_from_filename
+from pywikicli.converters import (
+    ContentConverterRegistry,
+    infer_format_from_filename,
+)
 
 logger = logging.getLogger(__name__)
 
+# Map CLI format options to actual format names
+_FORMAT_MAP = {
+    "md": "markdown",
+    "wiki": "mediawiki",
+    "html": "html",
+}
+
 
 class GetCommandService:
     """
@@ -22,14 +32,16 @@ class GetCommandService:
     Following the Single Responsibility Principle by separating CLI handling from business logic.
     """
 
-    def __init__(self, wiki_client: WikiApiInterface):
+    def __init__(self, wiki_client: WikiApiInterface, use_cache: bool = True):
         """
         Initialize the service with dependencies.
 
         Args:
             wiki_client: Client for interacting with wiki APIs
+            use_cache: Whether previous conversion results may be reused and stored
         """
         self.wiki_client = wiki_client
+        self.use_cache = use_cache
 
     def fetch_page(self, page_title: str) -> Optional[str]:
         """
@@ -57,26 +69,25 @@ class GetCommandService:
         Returns:
             str: Path to the saved file
         """
-        # Map CLI format options to actual format names
-        format_map = {
-            "md": "markdown",
-            "wiki": "mediawiki",
-            "html": "html",
-        }
-        target_format = format_map.get(output_format, "mediawiki")
-
-        # Convert content if needed
-        converted_content = ContentConverterRegistry.convert(
-            content, "mediawiki", target_format
-        )
+        target_format = _FORMAT_MAP.get(output_format, "mediawiki")
 
         # Generate filename
-        safe_name = page_title.replace(" ", "_").replace("/", "_")
+        safe_name = page_title.translate(SAFE_NAME_TABLE)
         filename = f"{safe_name}.{output_format}"
 
-        # Save to file
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(converted_content)
+        if target_format == "mediawiki":
+            # Already wiki text, nothing to convert
+            with open(filename, "wb") as f:
+                f.write(content.encode("utf-8"))
+        else:
+            # Convert content; the converter writes the file directly
+            ContentConverterRegistry.convert_to_file(
+                content,
+                "mediawiki",
+                target_format,
+                filename,
+                use_cache=self.use_cache,
+            )
 
         return filename
 
@@ -90,7 +101,7 @@ class GetCommandService:
         Returns:
             Optional[str]: URL to the page or None if not supported
         """
-        if isinstance(self.wiki_client, MediaWikiClient):
+        if hasattr(self.wiki_client, "get_page_url"):
             return self.wiki_client.get_page_url(page_title)
         return None
 
@@ -111,8 +122,11 @@ class GetCommandService:
     help="Write output to a file instead of printing to screen.",
 )
 @click.option("--show-url", is_flag=True, help="Show the URL to the page")
+@click.option(
+    "--no-cache", is_flag=True, help="Do not reuse or store pages and conversions"
+)
 @click.pass_context
-def get_command(ctx, page_title, output_format, writefile, show_url):
+def get_command(ctx, page_title, output_format, writefile, show_url, no_cache):
     """
     Fetch and display the content of a MediaWiki page.
 
@@ -127,11 +141,24 @@ def get_command(ctx, page_title, output_format, writefile, show_url):
       wikibot get "Main Page" --show-url
 
     """
-    config = load_config()
-    client = WikiClient(
-        config["api_url"], config.get("username"), config.get("password")
-    )
-    service = GetCommandService(client)
+    # Ensure API URL is configured
+    if "api_url" not in ctx.obj["config"]:
+        click.echo(
+            "Error: API URL not configured. Run 'pywikicli config' first.", err=True
+        )
+        sys.exit(1)
+
+    # Cache pages locally so repeated gets skip unchanged downloads. Cached
+    # pages are always checked against the wiki first, which costs a small
+    # revision query instead of the content, so edits made elsewhere and
+    # newly created pages show up at once.
+    cache = None
+    if not no_cache:
+        cache = PageCache()
+        ctx.call_on_close(cache.close)
+
+    client = get_client(ctx, cache=cache, refresh=True)
+    service = GetCommandService(client, use_cache=not no_cache)
 
     try:
         # Fetch page content
@@ -147,27 +174,19 @@ def get_command(ctx, page_title, output_format, writefile, show_url):
                 click.echo(f"Page URL: {page_url}")
 
         # Handle output according to format and writefile flag
-        if output_format:
-            # Convert content if needed
-            format_map = {
-                "md": "markdown",
-                "wiki": "mediawiki",
-                "html": "html",
-            }
-            target_format = format_map.get(output_format, "mediawiki")
-            converted_content = ContentConverterRegistry.convert(
-                content, "mediawiki", target_format
-            )
-            if writefile:
-                safe_name = page_title.replace(" ", "_").replace("/", "_")
-                filename = f"{safe_name}.{output_format}"
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(converted_content)
+        if output_format and writefile:
+            filename = service.save_page_as_format(page_title, content, output_format)
+            click.echo(f"Saved page '{page_title}' as {output_format} to {filename}")
+        elif output_format:
+            target_format = _FORMAT_MAP.get(output_format, "mediawiki")
+            if target_format == "mediawiki":
+                click.echo(content)
+            else:
                 click.echo(
-                    f"Saved page '{page_title}' as {output_format} to {filename}"
+                    ContentConverterRegistry.convert(
+                        content, "mediawiki", target_format, use_cache=not no_cache
+                    )
                 )
-            else:
-                click.echo(converted_content)
         else:
             # Default: print wiki text to stdout
             click.echo(content)
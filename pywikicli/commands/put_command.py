@@ -3,15 +3,20 @@ Implementation of the 'put' command for PyWikiCLI.
 """
 
 import click
+import io
 import logging
 import os
 import urllib.parse
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
-from pywikicli.api import WikiClient
+from pywikicli.cache import PageCache
+from pywikicli.commands import get_client
 from pywikicli.interfaces import WikiApiInterface
-from pywikicli.converters import ContentConverterRegistry, infer_format_from_filename
+from pywikicli.converters import (
+    ContentConverterRegistry,
+    infer_format_from_filename,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +33,9 @@ class PageNameExtractor:
         if not filename:
             return None
 
-        # Remove extension and directory path
+        # Remove directory path and extension; a leading dot is not an extension
         base_name = os.path.basename(filename)
-        page_name = os.path.splitext(base_name)[0]
+        page_name = base_name.rpartition(".")[0] or base_name
 
         # Replace underscores with spaces (MediaWiki convention)
         return page_name.replace("_", " ")
@@ -42,14 +47,16 @@ class PutCommandService:
     Following the Single Responsibility Principle by separating CLI handling from business logic.
     """
 
-    def __init__(self, wiki_client: WikiApiInterface):
+    def __init__(self, wiki_client: WikiApiInterface, use_cache: bool = True):
         """
         Initialize the service with dependencies.
 
         Args:
             wiki_client: Client for interacting with wiki APIs
+            use_cache: Whether previous conversion results may be reused and stored
         """
         self.wiki_client = wiki_client
+        self.use_cache = use_cache
 
     def load_content_from_file(self, file_path: str) -> tuple[str, str]:
         """
@@ -61,8 +68,20 @@ class PutCommandService:
         Returns:
             tuple[str, str]: (content, format)
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        # Read the raw bytes with as few syscalls as possible: one read sized
+        # from fstat, plus the read that confirms end of file
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            chunks = [os.read(fd, os.fstat(fd).st_size or io.DEFAULT_BUFFER_SIZE)]
+            while chunks[-1]:
+                chunks.append(os.read(fd, io.DEFAULT_BUFFER_SIZE))
+        finally:
+            os.close(fd)
+        content = b"".join(chunks).decode("utf-8")
+
+        # Normalize line endings as text mode reading would
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
 
         # Infer format from file extension
         source_format = infer_format_from_filename(file_path)
@@ -82,7 +101,39 @@ class PutCommandService:
         if source_format == "unknown" or source_format == "mediawiki":
             return content
 
-        return ContentConverterRegistry.convert(content, source_format, "mediawiki")
+        return ContentConverterRegistry.convert(
+            content, source_format, "mediawiki", use_cache=self.use_cache
+        )
+
+    def convert_many_to_wiki_format(
+        self, documents: List[Tuple[str, str]]
+    ) -> List[str]:
+        """
+        Convert several documents to MediaWiki format if needed.
+        Documents sharing a source format are converted together.
+
+        Args:
+            documents: (content, source_format) of each document
+
+        Returns:
+            List[str]: Contents in MediaWiki format, in input order
+        """
+        results = [content for content, _ in documents]
+        by_format = {}
+        for index, (_, source_format) in enumerate(documents):
+            if source_format not in ("unknown", "mediawiki"):
+                by_format.setdefault(source_format, []).append(index)
+
+        for source_format, indices in by_format.items():
+            converted = ContentConverterRegistry.convert_many(
+                [documents[index][0] for index in indices],
+                source_format,
+                "mediawiki",
+                use_cache=self.use_cache,
+            )
+            for index, wiki_content in zip(indices, converted):
+                results[index] = wiki_content
+        return results
 
     def update_wiki_page(
         self, page_title: str, content: str, summary: str, options: Dict[str, Any]
@@ -116,20 +167,69 @@ class PutCommandService:
         return None
 
 
+def put_page(
+    service: PutCommandService,
+    pagename: str,
+    wiki_content: str,
+    summary: str,
+    edit_options: Dict[str, Any],
+) -> bool:
+    """
+    Update one wiki page and report the outcome.
+
+    Args:
+        service: Service performing the edit
+        pagename: Title of the page to update
+        wiki_content: New content in MediaWiki format
+        summary: Edit summary
+        edit_options: Additional options for the edit
+
+    Returns:
+        bool: True if the page was updated, False otherwise
+    """
+    try:
+        # Update the wiki page
+        success = service.update_wiki_page(
+            pagename, wiki_content, summary, edit_options
+        )
+        if success:
+            click.echo(f"Successfully updated page '{pagename}'.")
+
+            # Show URL to the page if available
+            page_url = service.get_page_url(pagename)
+            if page_url:
+                click.echo(f"Page URL: {page_url}")
+        else:
+            click.echo(f"Failed to update page '{pagename}'.", err=True)
+        return success
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        logger.debug("Detailed error: %s", e, exc_info=True)
+        return False
+
+
 @click.command(
     name="put",
 )
-@click.argument("file_or_page", type=click.Path(exists=True), required=False)
+@click.argument(
+    "files", nargs=-1, type=click.Path(exists=True, dir_okay=False), required=False
+)
 @click.option(
-    "--pagename", "-p", help="Override the page name (default: derived from filename)"
+    "--pagename",
+    "-p",
+    help="Override the page name (default: derived from filename, single file only)",
 )
 @click.option("--content", "-c", help="New content as string")
 @click.option("--summary", "-m", default="", help="Edit summary")
 @click.option("--minor", is_flag=True, help="Mark as minor edit")
 @click.option("--bot", is_flag=True, help="Mark as bot edit")
-def put_command(file_or_page, pagename, content, summary, minor, bot):
+@click.option(
+    "--no-cache", is_flag=True, help="Do not reuse or store converted content"
+)
+@click.pass_context
+def put_command(ctx, files, pagename, content, summary, minor, bot, no_cache):
     """
-    Update or create a wiki page with given content.
+    Update or create wiki pages with given content.
 
     Examples:
 
@@ -139,14 +239,16 @@ def put_command(file_or_page, pagename, content, summary, minor, bot):
 
       wikibot put mypage.md --summary "Initial import" --minor
 
+      wikibot put docs/*.md --summary "Bulk import"
 
       wikibot put --pagename "Sandbox" --content "Test edit" --bot
 
-    You can provide content from a file (argument) or directly with --content.
-    If --pagename is not given, the page name is derived from the file name.
+    You can provide content from files (arguments) or directly with --content.
+    If --pagename is not given, each page name is derived from its file name.
+    Several files are uploaded in one session, logging in only once.
     """
     # Get configuration
-    cfg = click.get_current_context().obj["config"]
+    cfg = ctx.obj["config"]
 
     # Ensure API URL is configured
     if "api_url" not in cfg:
@@ -163,35 +265,18 @@ def put_command(file_or_page, pagename, content, summary, minor, bot):
         )
         return
 
-    # Initialize client and service
-    client = WikiClient(cfg["api_url"], cfg.get("username"), cfg.get("password"))
-    service = PutCommandService(client)
-
-    # Content determination
-    wiki_content = None
-    source_format = "mediawiki"  # Default format
-
-    if file_or_page and os.path.isfile(file_or_page):
-        # Get content from file
-        file_content, source_format = service.load_content_from_file(file_or_page)
-        wiki_content = service.convert_to_wiki_format(file_content, source_format)
-
-        # If pagename not explicitly provided, derive it from filename
-        if not pagename:
-            pagename = PageNameExtractor.from_filename(file_or_page)
-
-    elif content:
-        # Use content provided directly
-        wiki_content = content
-    else:
+    if not files and not content:
         click.echo(
             "Error: Provide content via --content option or specify a file path.",
             err=True,
         )
         return
 
-    # Ensure we have a page name
-    if not pagename:
+    if len(files) > 1 and pagename:
+        click.echo("Error: --pagename can only be used with a single file.", err=True)
+        return
+
+    if not files and not pagename:
         click.echo(
             "Error: Page name must be provided either via --pagename or in the filename.",
             err=True,
@@ -205,20 +290,34 @@ def put_command(file_or_page, pagename, content, summary, minor, bot):
     if bot:
         edit_options["bot"] = True
 
-    try:
-        # Update the wiki page
-        success = service.update_wiki_page(
-            pagename, wiki_content, summary, edit_options
-        )
-        if success:
-            click.echo(f"Successfully updated page '{pagename}'.")
+    # Initialize client and service; all pages share one authenticated session.
+    # The client gets the page cache so edited pages are evicted from it and
+    # a later get does not serve the old text.
+    cache = PageCache()
+    ctx.call_on_close(cache.close)
+    client = get_client(ctx, cache=cache)
+    service = PutCommandService(client, use_cache=not no_cache)
 
-            # Show URL to the page if available
-            page_url = service.get_page_url(pagename)
-            if page_url:
-                click.echo(f"Page URL: {page_url}")
-        else:
-            click.echo(f"Failed to update page '{pagename}'.", err=True)
-    except Exception as e:
-        click.echo(f"Error: {e}", err=True)
-        logger.debug(f"Detailed error: {str(e)}", exc_info=True)
+    if not files:
+        # Use content provided directly
+        put_page(service, pagename, content, summary, edit_options)
+        return
+
+    # If pagename not explicitly provided, derive it from filename
+    uploads = []
+    for file_path in files:
+        page = pagename or PageNameExtractor.from_filename(file_path)
+        if not page:
+            click.echo(
+                f"Error: Could not derive a page name from '{file_path}'.",
+                err=True,
+            )
+            continue
+        uploads.append((file_path, page))
+
+    # Convert all files up front, so their conversions can run in parallel
+    documents = [service.load_content_from_file(path) for path, _ in uploads]
+    wiki_contents = service.convert_many_to_wiki_format(documents)
+
+    for (_, page), wiki_content in zip(uploads, wiki_contents):
+        put_page(service, page, wiki_content, summary, edit_options)
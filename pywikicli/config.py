@@ -4,23 +4,50 @@ Handles loading and saving YAML configuration under ~/.pywikicli/.
 """
 
 import os
+import tempfile
+from functools import lru_cache
+from typing import Optional
+
 import yaml
 
+# The libyaml bindings parse several times faster when they are available
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 CONFIG_DIR = os.path.expanduser("~/.pywikicli")
 CONFIG_PATH = os.path.join(CONFIG_DIR, "config.yaml")
 
+# Session cookies, so consecutive commands reuse one login
+COOKIE_PATH = os.path.join(CONFIG_DIR, "cookies.txt")
+
 
-def load_config():
+def load_config(path: Optional[str] = None):
     """
     Load configuration from YAML file.
+    The parsed file is reused until it changes on disk.
+
+    Args:
+        path (str, optional): Configuration file, defaults to CONFIG_PATH
 
     Returns:
         dict: Configuration data or empty dict if file doesn't exist
     """
-    if not os.path.exists(CONFIG_PATH):
+    path = path or CONFIG_PATH
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
         return {}
-    with open(CONFIG_PATH) as f:
-        return yaml.safe_load(f) or {}
+    # Callers may modify the result, so hand out a copy of the cached data
+    return dict(_load_cached(path, st.st_mtime_ns, st.st_size, st.st_ino))
+
+
+@lru_cache(maxsize=4)
+def _load_cached(path: str, mtime_ns: int, size: int, inode: int) -> dict:
+    """
+    Parse a configuration file; the stat fields only key the cache.
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_Loader) or {}
 
 
 def save_config(data: dict):
@@ -30,7 +57,19 @@ def save_config(data: dict):
     Args:
         data (dict): Configuration data to save
     """
+    if os.path.exists(CONFIG_PATH) and data == load_config():
+        return  # Nothing changed, keep the file as it is
+
     os.makedirs(CONFIG_DIR, exist_ok=True)
-    with open(CONFIG_PATH, "w") as f:
-        yaml.safe_dump(data, f)
-    os.chmod(CONFIG_PATH, 0o600)  # Secure permissions for config file
+    # Write to a private temporary file and swap it in atomically, so an
+    # interrupted write never leaves a truncated config behind. mkstemp
+    # creates the file readable by the owner only.
+    fd, tmp_path = tempfile.mkstemp(dir=CONFIG_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            yaml.dump(data, f, Dumper=_Dumper)
+        os.replace(tmp_path, CONFIG_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    _load_cached.cache_clear()
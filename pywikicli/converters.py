@@ -3,13 +3,69 @@ Content conversion implementations for PyWikiCLI.
 Handles conversions between different formats (e.g., Markdown to MediaWiki).
 """
 
+import functools
+import hashlib
 import logging
-import pypandoc
-from typing import Dict, Optional, List, Type
+import os
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, List, Tuple, Type
+from pywikicli.cache import CACHE_DIR
 from pywikicli.interfaces import ContentConverter
 
 logger = logging.getLogger(__name__)
 
+# Number of conversion results PandocConverter keeps in memory
+CONVERSION_CACHE_SIZE = 128
+
+# Directory where conversion results persist between CLI invocations
+CONVERSION_CACHE_DIR = os.path.join(CACHE_DIR, "conv")
+
+# Seconds a persisted conversion result is kept after it was last used
+CONVERSION_CACHE_MAX_AGE = 30 * 24 * 3600
+
+
+def _write_utf8(path: str, text: str) -> None:
+    """
+    Write text to a file as UTF-8 in a single write.
+
+    Args:
+        path: Path of the file to write
+        text: Text to write
+    """
+    with open(path, "wb") as f:
+        f.write(text.encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=None)
+def _pandoc_identity() -> str:
+    """
+    Identify the installed pandoc, so results of another version are not reused.
+    The binary's path, size and modification time change whenever pandoc is
+    upgraded, and reading them avoids starting a pandoc process to ask for
+    its version; the version is only asked when the binary cannot be found.
+
+    Returns:
+        str: Identity of the pandoc installation
+    """
+    path = os.environ.get("PYPANDOC_PANDOC") or shutil.which("pandoc")
+    if path:
+        try:
+            st = os.stat(path)
+            return f"{os.path.realpath(path)}|{st.st_size}|{st.st_mtime_ns}"
+        except OSError:
+            pass
+
+    import pypandoc
+
+    try:
+        return pypandoc.get_pandoc_version()
+    except Exception:
+        return "unknown"
+
 
 class PandocConverter(ContentConverter):
     """
@@ -28,6 +84,41 @@ class PandocConverter(ContentConverter):
         # Add more supported formats as needed
     }
 
+    def __init__(
+        self,
+        cache_size: int = CONVERSION_CACHE_SIZE,
+        cache_dir: Optional[str] = CONVERSION_CACHE_DIR,
+    ):
+        """
+        Initialize the converter.
+
+        Args:
+            cache_size: Number of recent conversion results to keep, 0 to disable
+            cache_dir: Directory to persist conversion results in, None to disable
+        """
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        self._results: "OrderedDict[str, str]" = OrderedDict()
+        self._pruned = False
+
+    def uncached(self) -> "PandocConverter":
+        """
+        Get a pandoc converter that neither reuses nor stores results.
+
+        Returns:
+            PandocConverter: Converter without memory or disk cache
+        """
+        return type(self)(cache_size=0, cache_dir=None)
+
+    def supported_pairs(self) -> Iterable[Tuple[str, str]]:
+        """
+        List the format conversions this converter supports.
+
+        Returns:
+            Iterable[Tuple[str, str]]: Lowercased (source, target) format pairs
+        """
+        return self.SUPPORTED_CONVERSIONS.keys()
+
     def can_convert(self, source_format: str, target_format: str) -> bool:
         """
         Check if this converter supports the specified format conversion.
@@ -62,13 +153,293 @@ class PandocConverter(ContentConverter):
             )
             return content
 
+        source_format = source_format.lower()
+        target_format = target_format.lower()
+
+        # Running pandoc costs a process start; reuse results for repeated input
+        key = self._key(content, source_format, target_format)
+        converted = self._lookup(key, target_format)
+        if converted is not None:
+            return converted
+
+        # Imported on first use, so commands that never convert skip it
+        import pypandoc
+
         try:
-            return pypandoc.convert_text(
-                content, target_format.lower(), format=source_format.lower()
+            converted = pypandoc.convert_text(
+                content, target_format, format=source_format
             )
         except Exception as e:
             logger.error(f"Format conversion error: {e}")
             return content
+        self._save(key, target_format, converted)
+        self._remember(key, converted)
+        return converted
+
+    def convert_many(
+        self, contents: List[str], source_format: str, target_format: str
+    ) -> List[str]:
+        """
+        Convert several documents using pandoc.
+        Pandoc reads all of its input before converting, so one process cannot
+        serve several documents; instead the processes run concurrently, which
+        hides most of their start-up time.
+
+        Args:
+            contents: Contents to convert
+            source_format: Source content format
+            target_format: Target content format
+
+        Returns:
+            List[str]: Converted contents in input order; documents that fail
+                to convert are returned unchanged
+        """
+        if not self.can_convert(source_format, target_format):
+            logger.warning(
+                f"Unsupported conversion: {source_format} to {target_format}"
+            )
+            return list(contents)
+
+        source_format = source_format.lower()
+        target_format = target_format.lower()
+        keys = [
+            self._key(content, source_format, target_format) for content in contents
+        ]
+
+        results = {}
+        todo = {}
+        for key, content in zip(keys, contents):
+            if key in results or key in todo:
+                continue
+            converted = self._lookup(key, target_format)
+            if converted is None:
+                todo[key] = content
+            else:
+                results[key] = converted
+
+        if todo:
+            import pypandoc
+
+            workers = min(len(todo), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    key: executor.submit(
+                        pypandoc.convert_text,
+                        content,
+                        target_format,
+                        format=source_format,
+                    )
+                    for key, content in todo.items()
+                }
+            # Cache bookkeeping stays on this thread
+            for key, future in futures.items():
+                try:
+                    converted = future.result()
+                except Exception as e:
+                    logger.error(f"Format conversion error: {e}")
+                    results[key] = todo[key]
+                    continue
+                self._save(key, target_format, converted)
+                self._remember(key, converted)
+                results[key] = converted
+
+        return [results[key] for key in keys]
+
+    def convert_to_file(
+        self, content: str, source_format: str, target_format: str, output_path: str
+    ) -> None:
+        """
+        Convert content using pandoc and write the result to a file.
+        Pandoc writes the file itself, so the result never passes through Python.
+
+        Args:
+            content: Content to convert
+            source_format: Source content format
+            target_format: Target content format
+            output_path: Path of the file to write
+        """
+        if not self.can_convert(source_format, target_format):
+            logger.warning(
+                f"Unsupported conversion: {source_format} to {target_format}"
+            )
+            _write_utf8(output_path, content)
+            return
+
+        source_format = source_format.lower()
+        target_format = target_format.lower()
+        key = self._key(content, source_format, target_format)
+        if key in self._results:
+            self._results.move_to_end(key)
+            _write_utf8(output_path, self._results[key])
+            return
+
+        cache_path = self._cache_path(key, target_format)
+        if cache_path is not None and os.path.exists(cache_path):
+            shutil.copyfile(cache_path, output_path)
+            self._touch(cache_path)
+            return
+
+        import pypandoc
+
+        try:
+            pypandoc.convert_text(
+                content, target_format, format=source_format, outputfile=output_path
+            )
+        except Exception as e:
+            logger.error(f"Format conversion error: {e}")
+            _write_utf8(output_path, content)
+            return
+
+        if cache_path is not None:
+            try:
+                self._prepare_cache_dir()
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+                os.close(fd)
+                shutil.copyfile(output_path, tmp_path)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.debug("Could not cache conversion result: %s", e)
+
+    @staticmethod
+    def _key(content: str, source_format: str, target_format: str) -> str:
+        """
+        Digest identifying a conversion.
+
+        Args:
+            content: Content to convert
+            source_format: Lowercased source content format
+            target_format: Lowercased target content format
+
+        Returns:
+            str: Hex digest of the pandoc installation, formats and content
+        """
+        return hashlib.blake2b(
+            f"{_pandoc_identity()}|{source_format}|{target_format}|".encode("utf-8")
+            + content.encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+
+    def _lookup(self, key: str, target_format: str) -> Optional[str]:
+        """
+        Find a previous conversion result in memory or on disk.
+
+        Args:
+            key: Digest of the conversion input
+            target_format: Target content format
+
+        Returns:
+            Optional[str]: Converted content or None if not cached
+        """
+        if key in self._results:
+            self._results.move_to_end(key)
+            return self._results[key]
+        converted = self._load(key, target_format)
+        if converted is not None:
+            self._remember(key, converted)
+        return converted
+
+    def _remember(self, key: str, converted: str) -> None:
+        """
+        Keep a conversion result in memory, evicting the least recently used.
+
+        Args:
+            key: Digest of the conversion input
+            converted: Converted content
+        """
+        if self.cache_size > 0:
+            self._results[key] = converted
+            if len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+
+    def _cache_path(self, key: str, target_format: str) -> Optional[str]:
+        """
+        Path of a persisted conversion result.
+
+        Args:
+            key: Digest of the conversion input
+            target_format: Target content format
+
+        Returns:
+            Optional[str]: File path, or None if results are not persisted
+        """
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"{key}.{target_format}")
+
+    def _load(self, key: str, target_format: str) -> Optional[str]:
+        """
+        Read a persisted conversion result.
+
+        Args:
+            key: Digest of the conversion input
+            target_format: Target content format
+
+        Returns:
+            Optional[str]: Converted content or None if not persisted
+        """
+        path = self._cache_path(key, target_format)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                converted = f.read().decode("utf-8")
+        except FileNotFoundError:
+            return None
+        self._touch(path)
+        return converted
+
+    def _save(self, key: str, target_format: str, converted: str) -> None:
+        """
+        Persist a conversion result; failures only cost the cached copy.
+
+        Args:
+            key: Digest of the conversion input
+            target_format: Target content format
+            converted: Converted content
+        """
+        if self.cache_dir is None:
+            return
+        try:
+            self._prepare_cache_dir()
+            # Write to a temporary file and swap it in, so readers never
+            # see a partially written result
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(converted.encode("utf-8"))
+            os.replace(tmp_path, self._cache_path(key, target_format))
+        except OSError as e:
+            logger.debug("Could not cache conversion result: %s", e)
+
+    def _prepare_cache_dir(self) -> None:
+        """
+        Create the cache directory and, once per converter, delete results
+        not used within CONVERSION_CACHE_MAX_AGE so the directory stays bounded.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        if self._pruned:
+            return
+        self._pruned = True
+        cutoff = time.time() - CONVERSION_CACHE_MAX_AGE
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError as e:
+                    logger.debug("Could not prune conversion result: %s", e)
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        """
+        Mark a persisted conversion result as used, so pruning keeps it.
+
+        Args:
+            path: Path of the persisted result
+        """
+        try:
+            os.utime(path)
+        except OSError:
+            pass
 
 
 class IdentityConverter(ContentConverter):
@@ -77,6 +448,16 @@ class IdentityConverter(ContentConverter):
     Used as a fallback when no conversion is needed or possible.
     """
 
+    def supported_pairs(self) -> Iterable[Tuple[str, str]]:
+        """
+        List the format conversions this converter supports.
+        Identical formats are handled by the registry, so no pairs are declared.
+
+        Returns:
+            Iterable[Tuple[str, str]]: Empty
+        """
+        return ()
+
     def can_convert(self, source_format: str, target_format: str) -> bool:
         """
         Check if this converter supports the specified format conversion.
@@ -106,6 +487,10 @@ class IdentityConverter(ContentConverter):
         return content
 
 
+# Shared instance; the identity converter has no state
+_IDENTITY = IdentityConverter()
+
+
 class ContentConverterRegistry:
     """
     Registry of content converters.
@@ -114,15 +499,22 @@ class ContentConverterRegistry:
 
     _converters: List[ContentConverter] = []
 
+    # Converter per lowercased (source, target) pair declared at registration
+    _by_pair: Dict[Tuple[str, str], ContentConverter] = {}
+
     @classmethod
     def register(cls, converter: ContentConverter) -> None:
         """
         Register a converter.
+        Converters that declare their supported pairs are indexed by pair;
+        earlier registrations take precedence.
 
         Args:
             converter: Converter instance to register
         """
         cls._converters.append(converter)
+        for pair in converter.supported_pairs() or ():
+            cls._by_pair.setdefault(pair, converter)
 
     @classmethod
     def get_converter(
@@ -138,20 +530,52 @@ class ContentConverterRegistry:
         Returns:
             Optional[ContentConverter]: Appropriate converter or None if none found
         """
+        key = (source_format.lower(), target_format.lower())
+
         # First check if formats are the same - use identity converter
-        if source_format.lower() == target_format.lower():
-            return IdentityConverter()
+        if key[0] == key[1]:
+            return _IDENTITY
 
-        # Find a converter that supports this conversion
+        converter = cls._by_pair.get(key)
+        if converter is not None:
+            return converter
+
+        # Ask converters that do not declare their pairs up front
         for converter in cls._converters:
-            if converter.can_convert(source_format, target_format):
+            if converter.supported_pairs() is None and converter.can_convert(*key):
                 return converter
 
         # No converter found
         return None
 
     @classmethod
-    def convert(cls, content: str, source_format: str, target_format: str) -> str:
+    def _converter_for(
+        cls, source_format: str, target_format: str, use_cache: bool
+    ) -> Optional[ContentConverter]:
+        """
+        Get a converter for a conversion, honouring the cache choice.
+
+        Args:
+            source_format: Source content format
+            target_format: Target content format
+            use_cache: Whether the converter may reuse and store results
+
+        Returns:
+            Optional[ContentConverter]: Appropriate converter or None if none found
+        """
+        converter = cls.get_converter(source_format, target_format)
+        if converter is not None and not use_cache:
+            return converter.uncached()
+        return converter
+
+    @classmethod
+    def convert(
+        cls,
+        content: str,
+        source_format: str,
+        target_format: str,
+        use_cache: bool = True,
+    ) -> str:
         """
         Convert content from source format to target format.
 
@@ -159,21 +583,89 @@ class ContentConverterRegistry:
             content: Content to convert
             source_format: Source content format
             target_format: Target content format
+            use_cache: Whether previous conversion results may be reused and stored
 
         Returns:
             str: Converted content or original content if no converter found
         """
-        converter = cls.get_converter(source_format, target_format)
+        converter = cls._converter_for(source_format, target_format, use_cache)
         if converter:
             return converter.convert(content, source_format, target_format)
         else:
             logger.warning(f"No converter found for {source_format} to {target_format}")
             return content
 
+    @classmethod
+    def convert_many(
+        cls,
+        contents: List[str],
+        source_format: str,
+        target_format: str,
+        use_cache: bool = True,
+    ) -> List[str]:
+        """
+        Convert several documents from source format to target format.
+
+        Args:
+            contents: Contents to convert
+            source_format: Source content format
+            target_format: Target content format
+            use_cache: Whether previous conversion results may be reused and stored
+
+        Returns:
+            List[str]: Converted contents, or the originals if no converter found
+        """
+        converter = cls._converter_for(source_format, target_format, use_cache)
+        if converter:
+            return converter.convert_many(contents, source_format, target_format)
+        logger.warning(f"No converter found for {source_format} to {target_format}")
+        return list(contents)
+
+    @classmethod
+    def convert_to_file(
+        cls,
+        content: str,
+        source_format: str,
+        target_format: str,
+        output_path: str,
+        use_cache: bool = True,
+    ) -> None:
+        """
+        Convert content and write the result to a file.
+
+        Args:
+            content: Content to convert
+            source_format: Source content format
+            target_format: Target content format
+            output_path: Path of the file to write; gets the original content
+                if no converter is found
+            use_cache: Whether previous conversion results may be reused and stored
+        """
+        converter = cls._converter_for(source_format, target_format, use_cache)
+        if converter:
+            converter.convert_to_file(
+                content, source_format, target_format, output_path
+            )
+        else:
+            logger.warning(f"No converter found for {source_format} to {target_format}")
+            _write_utf8(output_path, content)
+
 
 # Register built-in converters
 ContentConverterRegistry.register(PandocConverter())
-ContentConverterRegistry.register(IdentityConverter())
+ContentConverterRegistry.register(_IDENTITY)
+
+
+# Content format per lowercased file extension
+_FORMAT_BY_EXTENSION = {
+    "md": "markdown",
+    "markdown": "markdown",
+    "wiki": "mediawiki",
+    "mediawiki": "mediawiki",
+    "html": "html",
+    "htm": "html",
+    "txt": "text",
+}
 
 
 def infer_format_from_filename(filename: str) -> str:
@@ -189,18 +681,8 @@ def infer_format_from_filename(filename: str) -> str:
     if not filename:
         return "unknown"
 
-    # Get file extension (lowercase, without leading dot)
-    ext = filename.split(".")[-1].lower() if "." in filename else ""
-
-    # Map extensions to formats
-    format_map = {
-        "md": "markdown",
-        "markdown": "markdown",
-        "wiki": "mediawiki",
-        "mediawiki": "mediawiki",
-        "html": "html",
-        "htm": "html",
-        "txt": "text",
-    }
-
-    return format_map.get(ext, "unknown")
+    # Get file extension (without leading dot)
+    _, dot, ext = filename.rpartition(".")
+    if not dot:
+        return "unknown"
+    return _FORMAT_BY_EXTENSION.get(ext.lower(), "unknown")
@@ -1,13 +1,17 @@
 """
 Interfaces for PyWikiCLI components.
 Defines abstractions for different service responsibilities.
+
+The interfaces are protocols: implementations may subclass them to inherit
+default methods and have abstract methods checked, or simply provide the
+methods (e.g. test doubles) and still satisfy type checkers.
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
+from abc import abstractmethod
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Protocol, Tuple
 
 
-class AuthenticationService(ABC):
+class AuthenticationService(Protocol):
     """Interface for wiki authentication services."""
 
     @abstractmethod
@@ -29,7 +33,7 @@ class AuthenticationService(ABC):
         pass
 
 
-class PageService(ABC):
+class PageService(Protocol):
     """Interface for wiki page operations."""
 
     @abstractmethod
@@ -59,8 +63,22 @@ class PageService(ABC):
         """
         pass
 
+    def get_pages_batch(self, titles: List[str]) -> Dict[str, Optional[str]]:
+        """Retrieve content of several wiki pages.
+
+        Implementations should override this to fetch all titles in as few
+        API requests as possible; the default falls back to get_page.
+
+        Args:
+            titles: Titles of the wiki pages
+
+        Returns:
+            Dict[str, Optional[str]]: Content per requested title, None if missing
+        """
+        return {title: self.get_page(title) for title in titles}
+
 
-class LinkService(ABC):
+class LinkService(Protocol):
     """Interface for wiki link operations."""
 
     @abstractmethod
@@ -75,16 +93,80 @@ class LinkService(ABC):
         """
         pass
 
+    def iter_links(self, title: str) -> Iterator[str]:
+        """Iterate over the links from a wiki page.
+
+        Implementations can override this to yield links while the rest are
+        still being fetched; the default falls back to get_links.
+
+        Args:
+            title: Title of the wiki page
+
+        Returns:
+            Iterator[str]: Titles of the pages linked from the page
+        """
+        return iter(self.get_links(title))
 
-class WikiApiInterface(AuthenticationService, PageService, LinkService):
+    def get_links_batch(self, titles: List[str]) -> Dict[str, List[str]]:
+        """Get all links from several wiki pages.
+
+        Implementations should override this to fetch all titles in as few
+        API requests as possible; the default falls back to get_links.
+
+        Args:
+            titles: Titles of the wiki pages
+
+        Returns:
+            Dict[str, List[str]]: Linked page titles per requested title
+        """
+        return {title: self.get_links(title) for title in titles}
+
+
+class WikiApiInterface(AuthenticationService, PageService, LinkService, Protocol):
     """Composite interface for all wiki API operations."""
 
-    pass
+    def walk_from(self, title: str) -> Iterator[Tuple[str, Optional[str]]]:
+        """Iterate over the pages linked from a wiki page with their content.
+
+        Implementations can override this to fetch links and content
+        together; the default falls back to get_links and get_pages_batch.
 
+        Args:
+            title: Title of the wiki page
+
+        Returns:
+            Iterator[Tuple[str, Optional[str]]]: (title, content) of each
+            linked page, with content None for missing pages
+        """
+        return iter(self.get_pages_batch(self.get_links(title)).items())
 
-class ContentConverter(ABC):
+
+class ContentConverter(Protocol):
     """Interface for content format conversion."""
 
+    def supported_pairs(self) -> Optional[Iterable[Tuple[str, str]]]:
+        """List the format conversions this converter supports.
+
+        Declaring the pairs lets the registry index the converter by pair;
+        the default None makes the registry ask can_convert instead.
+
+        Returns:
+            Optional[Iterable[Tuple[str, str]]]: Lowercased (source, target)
+                format pairs, or None if not known up front
+        """
+        return None
+
+    def uncached(self) -> "ContentConverter":
+        """Get a converter that neither reuses nor stores conversion results.
+
+        Converters that cache results override this; the default returns the
+        converter itself.
+
+        Returns:
+            ContentConverter: Converter that does not cache results
+        """
+        return self
+
     @abstractmethod
     def can_convert(self, source_format: str, target_format: str) -> bool:
         """Check if this converter supports the specified format conversion.
@@ -112,8 +194,46 @@ class ContentConverter(ABC):
         """
         pass
 
+    def convert_to_file(
+        self, content: str, source_format: str, target_format: str, output_path: str
+    ) -> None:
+        """Convert content and write the result to a file.
+
+        Implementations can override this to write the result without holding
+        it in memory; the default writes the result of convert.
+
+        Args:
+            content: Content to convert
+            source_format: Source content format
+            target_format: Target content format
+            output_path: Path of the file to write
+        """
+        converted = self.convert(content, source_format, target_format)
+        with open(output_path, "wb") as f:
+            f.write(converted.encode("utf-8"))
+
+    def convert_many(
+        self, contents: List[str], source_format: str, target_format: str
+    ) -> List[str]:
+        """Convert several documents between the same formats.
+
+        Implementations can override this to share work between documents;
+        the default converts them one by one.
+
+        Args:
+            contents: Contents to convert
+            source_format: Source content format
+            target_format: Target content format
+
+        Returns:
+            List[str]: Converted contents in input order
+        """
+        return [
+            self.convert(content, source_format, target_format) for content in contents
+        ]
+
 
-class UrlGenerator(ABC):
+class UrlGenerator(Protocol):
     """Interface for generating URLs to wiki resources."""
 
     @abstractmethod
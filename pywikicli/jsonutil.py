@@ -0,0 +1,44 @@
+"""
+JSON helpers for PyWikiCLI.
+Use orjson when it is installed and fall back to the standard library.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "speedups" extra
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Decode JSON text.
+
+    Args:
+        data: JSON text, as str or UTF-8 bytes
+
+    Returns:
+        Any: Decoded data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any, indent: bool = False) -> str:
+    """
+    Encode data as JSON text.
+
+    Args:
+        value: JSON-serializable data
+        indent: Indent nested structures by two spaces, e.g. for debug output
+
+    Returns:
+        str: JSON text
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(value, option=option).decode("utf-8")
+    return json.dumps(value, indent=2 if indent else None)
@@ -0,0 +1,43 @@
+"""
+Wikitext helpers for PyWikiCLI.
+Extracts information from page content without extra API requests.
+"""
+
+import re
+from typing import List
+
+# [[Target]], [[Target|label]] and [[Target#Section|label]]; the target is group 1
+_WIKILINK_RE = re.compile(r"\[\[([^\[\]{}|#<>]*)(?:#[^\[\]|]*)?(?:\|[^\[\]]*)?\]\]")
+
+# Namespaces whose [[...]] syntax embeds or categorizes instead of linking,
+# unless the target starts with a colon
+_NON_LINK_PREFIXES = ("category:", "file:", "image:", "media:")
+
+_WHITESPACE_RE = re.compile(r"[\s_]+")
+
+
+def extract_links(content: str) -> List[str]:
+    """
+    Extract the targets of wiki links from page content.
+
+    This is an approximation of the API's prop=links: links produced by
+    templates are not seen, and titles are normalized with the default
+    first-letter capitalization.
+
+    Args:
+        content: Wikitext of the page
+
+    Returns:
+        List[str]: Linked page titles in order of first appearance
+    """
+    links = {}
+    for match in _WIKILINK_RE.finditer(content):
+        target = _WHITESPACE_RE.sub(" ", match.group(1)).strip()
+        if target.startswith(":"):
+            target = target[1:].lstrip()
+        elif target.lower().startswith(_NON_LINK_PREFIXES):
+            continue
+        if not target:
+            continue
+        links[target[0].upper() + target[1:]] = None
+    return list(links)
@@ -0,0 +1,595 @@
+"""
+Tests for the MediaWiki API client.
+"""
+
+import json
+import os
+from http.cookiejar import LWPCookieJar
+
+import requests
+
+from pywikicli.api import (
+    MediaWikiClient,
+    MediaWikiSession,
+    RateLimiter,
+    create_session,
+)
+from pywikicli.cache import PageCache
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, data, status_code=200, headers=None):
+        self.data = data
+        self.content = json.dumps(data).encode("utf-8")
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """Session that replays canned API responses and records requests."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.methods = []
+        self.headers = []
+
+    def post(self, url, data=None, **kwargs):
+        self.requests.append(dict(data))
+        self.methods.append("POST")
+        return self._respond()
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        self.requests.append(dict(params))
+        self.methods.append("GET")
+        self.headers.append(headers or {})
+        return self._respond()
+
+    def _respond(self):
+        response = self.responses.pop(0)
+        if isinstance(response, FakeResponse):
+            return response
+        return FakeResponse(response)
+
+
+def make_client(responses, cache=None):
+    client = MediaWikiClient("https://wiki.example.com/w/api.php", cache=cache)
+    session = FakeSession(responses)
+    client.page_service.session = session
+    client.link_service.session = session
+    return client, session
+
+
+def test_get_pages_batch_maps_normalized_titles():
+    """Batched page fetches send one request and map results back."""
+    client, session = make_client(
+        [
+            {
+                "query": {
+                    "normalized": [{"from": "main page", "to": "Main page"}],
+                    "pages": [
+                        {
+                            "title": "Main page",
+                            "revisions": [{"slots": {"main": {"content": "Welcome"}}}],
+                        },
+                        {"title": "Nope", "missing": True},
+                    ],
+                }
+            }
+        ]
+    )
+
+    pages = client.get_pages_batch(["main page", "Nope"])
+
+    assert pages == {"main page": "Welcome", "Nope": None}
+    assert len(session.requests) == 1
+    assert session.requests[0]["titles"] == "main page|Nope"
+    assert session.requests[0]["formatversion"] == "2"
+
+
+def test_high_limit_batches_are_posted():
+    """500-title batches go in the request body instead of the URL."""
+    titles = [f"Page number {i}" for i in range(500)]
+    client, session = make_client(
+        [{"query": {"pages": [{"title": t, "missing": True} for t in titles]}}]
+    )
+    client.page_service.titles_per_request = 500
+
+    pages = client.get_pages_batch(titles)
+
+    assert pages == dict.fromkeys(titles)
+    assert session.methods == ["POST"]
+    assert session.requests[0]["titles"].count("|") == 499
+
+
+def test_get_links_batch_follows_continuation():
+    """Link batches merge results across continuation responses."""
+    client, session = make_client(
+        [
+            {
+                "continue": {"plcontinue": "1|0|B", "continue": "||"},
+                "query": {
+                    "pages": [
+                        {"title": "A", "links": [{"title": "X"}]},
+                        {"title": "B"},
+                    ]
+                },
+            },
+            {
+                "query": {
+                    "pages": [
+                        {"title": "A"},
+                        {"title": "B", "links": [{"title": "Y"}]},
+                    ]
+                }
+            },
+        ]
+    )
+
+    links = client.get_links_batch(["A", "B"])
+
+    assert links == {"A": ["X"], "B": ["Y"]}
+    assert session.requests[1]["plcontinue"] == "1|0|B"
+
+
+def test_iter_links_yields_before_continuing():
+    """Links of the first response are available before the next request."""
+    client, session = make_client(
+        [
+            {
+                "continue": {"plcontinue": "1|0|Y", "continue": "||"},
+                "query": {"pages": [{"title": "A", "links": [{"title": "X"}]}]},
+            },
+            {"query": {"pages": [{"title": "A", "links": [{"title": "Y"}]}]}},
+        ]
+    )
+
+    links = client.iter_links("A")
+
+    assert next(links) == "X"
+    assert len(session.requests) == 1
+    assert list(links) == ["Y"]
+    assert session.requests[1]["plcontinue"] == "1|0|Y"
+
+
+def test_walk_from_yields_linked_pages_with_content():
+    """Linked pages arrive with their content, across continuations."""
+    client, session = make_client(
+        [
+            {
+                "continue": {"rvcontinue": "2|0", "continue": "gplcontinue||"},
+                "query": {
+                    "pages": [
+                        {
+                            "title": "X",
+                            "revisions": [{"slots": {"main": {"content": "x"}}}],
+                        },
+                        {"title": "Y"},
+                        {"title": "Z", "missing": True},
+                    ]
+                },
+            },
+            {
+                "query": {
+                    "pages": [
+                        {"title": "X"},
+                        {
+                            "title": "Y",
+                            "revisions": [{"slots": {"main": {"content": "y"}}}],
+                        },
+                    ]
+                }
+            },
+        ]
+    )
+
+    pages = list(client.walk_from("A"))
+
+    assert pages == [("X", "x"), ("Z", None), ("Y", "y")]
+    assert session.requests[0]["generator"] == "links"
+    assert session.requests[1]["rvcontinue"] == "2|0"
+
+
+def test_login_raises_batch_size_for_apihighlimits():
+    """Accounts with apihighlimits batch up to 500 titles per query."""
+    client, session = make_client(
+        [
+            {"query": {"tokens": {"logintoken": "t+\\"}}},
+            {"login": {"result": "Success"}},
+            {"query": {"userinfo": {"rights": ["read", "apihighlimits"]}}},
+        ]
+    )
+    client.auth_service.session = session
+    client.auth_service.username = "bot"
+    client.auth_service.password = "secret"
+
+    assert client.titles_per_request == 50
+    assert client.login()
+    assert client.titles_per_request == 500
+    assert client.link_service.titles_per_request == 500
+
+
+def test_login_is_deferred_until_reads_are_denied():
+    """Reads are tried anonymously; a denied read logs in and retries."""
+    client = MediaWikiClient(
+        "https://wiki.example.com/w/api.php", username="bot", password="secret"
+    )
+    session = FakeSession(
+        [
+            {"error": {"code": "readapidenied"}},
+            {"query": {"tokens": {"logintoken": "t+\\"}}},
+            {"login": {"result": "Success"}},
+            {"query": {"userinfo": {"rights": ["read"]}}},
+            {
+                "query": {
+                    "pages": [
+                        {
+                            "title": "Main",
+                            "revisions": [{"slots": {"main": {"content": "Hi"}}}],
+                        }
+                    ]
+                }
+            },
+        ]
+    )
+    client.auth_service.session = session
+    client.page_service.session = session
+
+    assert not client.is_authenticated()
+    assert client.get_page("Main") == "Hi"
+    assert client.is_authenticated()
+    assert session.requests[1]["meta"] == "tokens"
+
+
+def test_batched_reads_log_in_when_denied(caplog):
+    """Batched reads also retry after logging in, without logging errors."""
+    client = MediaWikiClient(
+        "https://wiki.example.com/w/api.php", username="bot", password="secret"
+    )
+    session = FakeSession(
+        [
+            {"error": {"code": "readapidenied", "info": "Login required"}},
+            {"query": {"tokens": {"logintoken": "t+\\"}}},
+            {"login": {"result": "Success"}},
+            {"query": {"userinfo": {"rights": ["read"]}}},
+            {
+                "query": {
+                    "pages": [
+                        {
+                            "title": "A",
+                            "revisions": [{"slots": {"main": {"content": "a"}}}],
+                        }
+                    ]
+                }
+            },
+        ]
+    )
+    client.auth_service.session = session
+    client.page_service.session = session
+
+    assert client.get_pages_batch(["A"]) == {"A": "a"}
+    assert client.is_authenticated()
+    assert not [r for r in caplog.records if r.levelname == "ERROR"]
+
+
+def test_iter_links_logs_in_when_denied():
+    """Streaming links also retries after logging in."""
+    client = MediaWikiClient(
+        "https://wiki.example.com/w/api.php", username="bot", password="secret"
+    )
+    session = FakeSession(
+        [
+            {"error": {"code": "readapidenied", "info": "Login required"}},
+            {"query": {"tokens": {"logintoken": "t+\\"}}},
+            {"login": {"result": "Success"}},
+            {"query": {"userinfo": {"rights": ["read"]}}},
+            {"query": {"pages": [{"title": "A", "links": [{"title": "X"}]}]}},
+        ]
+    )
+    client.auth_service.session = session
+    client.link_service.session = session
+
+    assert list(client.iter_links("A")) == ["X"]
+    assert client.is_authenticated()
+
+
+def test_walk_from_logs_in_when_denied():
+    """Walking linked pages also retries after logging in."""
+    client = MediaWikiClient(
+        "https://wiki.example.com/w/api.php", username="bot", password="secret"
+    )
+    session = FakeSession(
+        [
+            {"error": {"code": "readapidenied", "info": "Login required"}},
+            {"query": {"tokens": {"logintoken": "t+\\"}}},
+            {"login": {"result": "Success"}},
+            {"query": {"userinfo": {"rights": ["read"]}}},
+            {"query": {"pages": [{"title": "X", "missing": True}]}},
+        ]
+    )
+    client.auth_service.session = session
+    client.link_service.session = session
+
+    assert list(client.walk_from("A")) == [("X", None)]
+    assert client.is_authenticated()
+
+
+def test_login_reuses_saved_session(tmp_path):
+    """A still valid session from the cookie file skips the login requests."""
+    cookie_path = str(tmp_path / "cookies.txt")
+    jar = LWPCookieJar(cookie_path)
+    jar.set_cookie(requests.cookies.create_cookie("wikiSession", "abc"))
+    jar.save(ignore_discard=True)
+
+    client = MediaWikiClient(
+        "https://wiki.example.com/w/api.php", cookie_path=cookie_path
+    )
+    session = FakeSession(
+        [{"query": {"userinfo": {"id": 7, "name": "Bot", "rights": ["read"]}}}]
+    )
+    session.cookies = client.auth_service.session.cookies
+    client.auth_service.session = session
+    client.auth_service.username = "bot@crawler"
+    client.auth_service.password = "secret"
+
+    assert client.login()
+    assert client.is_authenticated()
+    assert len(session.requests) == 1
+    assert session.requests[0]["meta"] == "userinfo"
+
+
+def test_saved_cookies_are_private(tmp_path):
+    """The cookie file is readable by the owner only."""
+    cookie_path = tmp_path / "cookies.txt"
+    cookie_path.write_text("#LWP-Cookies-2.0\n")
+    os.chmod(cookie_path, 0o644)
+    client = MediaWikiClient(
+        "https://wiki.example.com/w/api.php", cookie_path=str(cookie_path)
+    )
+    client.auth_service.session.cookies.set_cookie(
+        requests.cookies.create_cookie("wikiSession", "abc")
+    )
+    client.auth_service._logged_in = True
+
+    client.auth_service.save_cookies()
+
+    assert os.stat(cookie_path).st_mode & 0o777 == 0o600
+    assert "wikiSession" in cookie_path.read_text()
+
+
+def test_cached_pages_skip_the_api(tmp_path):
+    """Pages served from the cache do not trigger another request."""
+    cache = PageCache(str(tmp_path / "cache.sqlite3"))
+    client, session = make_client(
+        [
+            {
+                "query": {
+                    "pages": [
+                        {
+                            "title": "Main",
+                            "lastrevid": 42,
+                            "revisions": [
+                                {"revid": 42, "slots": {"main": {"content": "Welcome"}}}
+                            ],
+                        }
+                    ]
+                }
+            }
+        ],
+        cache=cache,
+    )
+
+    assert client.get_pages_batch(["Main"]) == {"Main": "Welcome"}
+    assert client.get_page("Main") == "Welcome"
+    assert client.get_pages_batch(["Main"]) == {"Main": "Welcome"}
+    assert len(session.requests) == 1
+    cache.close()
+
+
+def test_missing_pages_are_cached(tmp_path):
+    """Pages reported missing are not requested again."""
+    cache = PageCache(str(tmp_path / "cache.sqlite3"))
+    client, session = make_client(
+        [{"query": {"pages": [{"title": "Nope", "missing": True}]}}],
+        cache=cache,
+    )
+
+    assert client.get_page("Nope") is None
+    assert client.get_pages_batch(["Nope"]) == {"Nope": None}
+    assert len(session.requests) == 1
+    cache.close()
+
+
+def test_refresh_requests_pages_cached_as_missing(tmp_path):
+    """With refresh, a page cached as missing is looked up again."""
+    cache = PageCache(str(tmp_path / "cache.sqlite3"))
+    client, session = make_client(
+        [
+            {"query": {"pages": [{"title": "New", "missing": True}]}},
+            {
+                "query": {
+                    "pages": [
+                        {
+                            "title": "New",
+                            "revisions": [{"slots": {"main": {"content": "Hi"}}}],
+                        }
+                    ]
+                }
+            },
+        ],
+        cache=cache,
+    )
+    client.page_service.refresh = True
+
+    assert client.get_page("New") is None
+    assert client.get_page("New") == "Hi"
+    assert len(session.requests) == 2
+    cache.close()
+
+
+def test_edit_evicts_cached_page(tmp_path):
+    """An edited page is fetched again instead of served from the cache."""
+    cache = PageCache(str(tmp_path / "cache.sqlite3"))
+    page = {
+        "query": {
+            "pages": [
+                {
+                    "title": "A",
+                    "revisions": [{"slots": {"main": {"content": "old"}}}],
+                }
+            ]
+        }
+    }
+    client, session = make_client(
+        [
+            page,
+            {"query": {"tokens": {"csrftoken": "t+\\"}}},
+            {"edit": {"result": "Success"}},
+            page,
+        ],
+        cache=cache,
+    )
+    client.auth_service._logged_in = True
+
+    client.get_page("A")
+    client.edit_page("A", "new")
+    client.get_page("A")
+
+    assert len(session.requests) == 4
+    cache.close()
+
+
+def test_expired_pages_are_revalidated_with_etag(tmp_path):
+    """An expired entry is re-requested conditionally and reused on 304."""
+    cache = PageCache(str(tmp_path / "cache.sqlite3"), ttl=-1)
+    page = {
+        "query": {
+            "pages": [
+                {
+                    "title": "Main",
+                    "lastrevid": 42,
+                    "revisions": [
+                        {"revid": 42, "slots": {"main": {"content": "Welcome"}}}
+                    ],
+                }
+            ]
+        }
+    }
+    client, session = make_client(
+        [
+            FakeResponse(page, headers={"ETag": '"abc"'}),
+            FakeResponse(None, status_code=304),
+        ],
+        cache=cache,
+    )
+
+    assert client.get_page("Main") == "Welcome"
+    assert client.get_page("Main") == "Welcome"
+    assert session.headers == [{}, {"If-None-Match": '"abc"'}]
+    cache.close()
+
+
+def test_expired_pages_are_revalidated_by_revision(tmp_path):
+    """Expired pages whose revision is unchanged are not downloaded again."""
+    cache = PageCache(str(tmp_path / "cache.sqlite3"), ttl=-1)
+
+    def page(title, revid, text):
+        return {
+            "title": title,
+            "lastrevid": revid,
+            "revisions": [{"revid": revid, "slots": {"main": {"content": text}}}],
+        }
+
+    client, session = make_client(
+        [
+            {"query": {"pages": [page("A", 1, "a"), page("B", 2, "b")]}},
+            {
+                "query": {
+                    "pages": [
+                        {"title": "A", "lastrevid": 1},
+                        {"title": "B", "lastrevid": 3},
+                    ]
+                }
+            },
+            {"query": {"pages": [page("B", 3, "b2")]}},
+        ],
+        cache=cache,
+    )
+
+    assert client.get_pages_batch(["A", "B"]) == {"A": "a", "B": "b"}
+    assert client.get_pages_batch(["A", "B"]) == {"A": "a", "B": "b2"}
+    assert session.requests[1]["prop"] == "info"
+    assert session.requests[2]["titles"] == "B"
+    cache.close()
+
+
+def test_session_adds_maxlag_and_retries_when_lagged(monkeypatch):
+    """Lagged responses are retried and every API call carries maxlag."""
+    lagged = requests.Response()
+    lagged.status_code = 200
+    lagged.headers.update({"MediaWiki-API-Error": "maxlag", "Retry-After": "0"})
+    ok = requests.Response()
+    ok.status_code = 200
+    responses = [lagged, ok]
+    sent = []
+
+    def fake_request(self, method, url, params=None, data=None, **kwargs):
+        sent.append(params)
+        return responses.pop(0)
+
+    monkeypatch.setattr(requests.Session, "request", fake_request)
+    session = MediaWikiSession(RateLimiter(None))
+
+    response = session.get(
+        "https://wiki.example.com/w/api.php", params={"action": "query"}
+    )
+
+    assert response is ok
+    assert sent == [{"action": "query", "maxlag": 5}] * 2
+
+
+def test_session_does_not_resend_posts():
+    """Transient failures retry reads, but never resend edits or logins."""
+    retry = create_session().get_adapter("https://wiki.example.com").max_retries
+
+    assert retry.is_retry("GET", 502)
+    assert not retry.is_retry("POST", 502)
+
+
+def test_client_closes_session_on_exit(monkeypatch):
+    closed = []
+    monkeypatch.setattr(requests.Session, "close", lambda self: closed.append(self))
+
+    with MediaWikiClient("https://wiki.example.com/w/api.php") as client:
+        session = client.auth_service.session
+
+    assert closed == [session]
+
+
+def test_csrf_token_is_reused_across_edits():
+    """Edits share one CSRF token and fetch a new one only on badtoken."""
+    client, session = make_client(
+        [
+            {"query": {"tokens": {"csrftoken": "t1+\\"}}},
+            {"edit": {"result": "Success"}},
+            {"edit": {"result": "Success"}},
+            {"error": {"code": "badtoken"}},
+            {"query": {"tokens": {"csrftoken": "t2+\\"}}},
+            {"edit": {"result": "Success"}},
+        ]
+    )
+    client.auth_service._logged_in = True
+
+    assert client.edit_page("A", "a")
+    assert client.edit_page("B", "b")
+    assert client.edit_page("C", "c")
+    assert [r.get("meta") for r in session.requests].count("tokens") == 2
+    assert session.requests[-1]["token"] == "t2+\\"
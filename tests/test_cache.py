@@ -0,0 +1,45 @@
+"""
+Tests for the persistent page cache.
+"""
+
+from pywikicli.cache import EXPIRED_GRACE_PERIOD, PageCache
+
+
+def test_cache_roundtrip(tmp_path):
+    """Stored values are returned until deleted."""
+    cache = PageCache(str(tmp_path / "cache.sqlite3"))
+    key = PageCache.make_key("page", "https://wiki.example.com/w/api.php", "Main")
+
+    cache.set(key, {"revid": 1, "content": "Hello"})
+    assert cache.get(key) == {"revid": 1, "content": "Hello"}
+
+    cache.delete(key)
+    assert cache.get(key) is None
+    cache.close()
+
+
+def test_cache_entries_expire(tmp_path):
+    """Expired entries are treated as missing."""
+    cache = PageCache(str(tmp_path / "cache.sqlite3"), ttl=0)
+
+    cache.set("key", "value", expire=-1)
+
+    assert cache.get("key", "default") == "default"
+    cache.close()
+
+
+def test_long_expired_entries_are_purged_on_open(tmp_path):
+    """Opening the cache drops entries expired beyond the grace period."""
+    path = str(tmp_path / "cache.sqlite3")
+    cache = PageCache(path)
+    cache.set("old", "value", expire=-EXPIRED_GRACE_PERIOD - 60)
+    cache.set("stale", "value", expire=-60)
+    cache.set("fresh", "value")
+    cache.close()
+
+    cache = PageCache(path)
+
+    assert cache.get("old", allow_expired=True) is None
+    assert cache.get("stale", allow_expired=True) == "value"
+    assert cache.get("fresh") == "value"
+    cache.close()
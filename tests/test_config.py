@@ -0,0 +1,90 @@
+"""
+Tests for configuration handling.
+"""
+
+import os
+
+from click.testing import CliRunner
+
+from pywikicli import config
+from pywikicli.cli import cli
+
+
+def use_tmp_config(monkeypatch, tmp_path):
+    """Point the config module at a temporary directory."""
+    monkeypatch.setattr(config, "CONFIG_DIR", str(tmp_path))
+    monkeypatch.setattr(config, "CONFIG_PATH", str(tmp_path / "config.yaml"))
+
+
+def test_save_config_roundtrip(monkeypatch, tmp_path):
+    """Saved configuration is private and loads back unchanged."""
+    use_tmp_config(monkeypatch, tmp_path)
+
+    config.save_config({"api_url": "https://wiki.example.com/w/api.php"})
+
+    assert config.load_config() == {"api_url": "https://wiki.example.com/w/api.php"}
+    assert os.stat(config.CONFIG_PATH).st_mode & 0o777 == 0o600
+    assert os.listdir(tmp_path) == ["config.yaml"]
+
+
+def test_load_config_sees_saved_changes(monkeypatch, tmp_path):
+    """Cached configuration is reloaded once the file is rewritten."""
+    use_tmp_config(monkeypatch, tmp_path)
+    config.save_config({"username": "bot"})
+    config.load_config()["username"] = "changed"
+
+    assert config.load_config() == {"username": "bot"}
+
+    config.save_config({"username": "other"})
+
+    assert config.load_config() == {"username": "other"}
+
+
+def test_save_config_skips_unchanged_data(monkeypatch, tmp_path):
+    """Saving the configuration already on disk does not rewrite the file."""
+    use_tmp_config(monkeypatch, tmp_path)
+    config.save_config({"username": "bot"})
+    inode = os.stat(config.CONFIG_PATH).st_ino
+
+    config.save_config({"username": "bot"})
+
+    assert os.stat(config.CONFIG_PATH).st_ino == inode
+
+
+def test_config_show_does_not_prompt(monkeypatch, tmp_path):
+    """--show prints the masked configuration without prompting."""
+    use_tmp_config(monkeypatch, tmp_path)
+    config.save_config({"username": "bot", "password": "secret"})
+
+    result = CliRunner().invoke(cli, ["config", "--show"])
+
+    assert result.exit_code == 0
+    assert "username: bot" in result.output
+    assert "secret" not in result.output
+
+
+def test_config_merges_into_loaded_configuration(monkeypatch, tmp_path):
+    """New settings are merged into the configuration the CLI loaded."""
+    use_tmp_config(monkeypatch, tmp_path)
+    monkeypatch.setattr("pywikicli.cli.load_config", lambda: {"rate_limit": 30})
+
+    result = CliRunner().invoke(
+        cli,
+        [
+            "config",
+            "--api-url",
+            "https://wiki.example.com/w/api.php",
+            "--username",
+            "bot",
+            "--password",
+            "secret",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert config.load_config() == {
+        "rate_limit": 30,
+        "api_url": "https://wiki.example.com/w/api.php",
+        "username": "bot",
+        "password": "secret",
+    }
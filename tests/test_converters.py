@@ -0,0 +1,208 @@
+"""
+Tests for content converters.
+"""
+
+import os
+import time
+
+from pywikicli.converters import (
+    CONVERSION_CACHE_MAX_AGE,
+    ContentConverterRegistry,
+    IdentityConverter,
+    PandocConverter,
+    infer_format_from_filename,
+)
+from pywikicli.interfaces import ContentConverter
+
+
+def test_get_converter_is_case_insensitive():
+    """Lookups resolve the same converter regardless of format case."""
+    converter = ContentConverterRegistry.get_converter("Markdown", "MediaWiki")
+
+    assert isinstance(converter, PandocConverter)
+    assert ContentConverterRegistry.get_converter("markdown", "mediawiki") is converter
+    assert ContentConverterRegistry.get_converter("text", "pdf") is None
+    assert ContentConverterRegistry.get_converter(
+        "HTML", "html"
+    ) is ContentConverterRegistry.get_converter("markdown", "markdown")
+
+
+def test_register_indexes_declared_pairs(monkeypatch):
+    """A newly registered converter is found for the pairs it declares."""
+
+    class PdfConverter(PandocConverter):
+        def supported_pairs(self):
+            return [("text", "pdf")]
+
+    monkeypatch.setattr(ContentConverterRegistry, "_converters", [])
+    monkeypatch.setattr(ContentConverterRegistry, "_by_pair", {})
+    assert ContentConverterRegistry.get_converter("text", "pdf") is None
+
+    converter = PdfConverter()
+    ContentConverterRegistry.register(converter)
+
+    assert ContentConverterRegistry.get_converter("text", "pdf") is converter
+
+
+def test_converters_without_declared_pairs_are_asked(monkeypatch):
+    """Converters that only implement can_convert are still found."""
+
+    class PdfConverter(IdentityConverter):
+        supported_pairs = ContentConverter.supported_pairs
+
+        def can_convert(self, source_format, target_format):
+            return (source_format, target_format) == ("text", "pdf")
+
+    monkeypatch.setattr(ContentConverterRegistry, "_converters", [])
+    monkeypatch.setattr(ContentConverterRegistry, "_by_pair", {})
+    converter = PdfConverter()
+    ContentConverterRegistry.register(converter)
+
+    assert ContentConverterRegistry.get_converter("Text", "PDF") is converter
+    assert ContentConverterRegistry.get_converter("text", "html") is None
+
+
+def test_pandoc_results_are_reused(monkeypatch):
+    """Converting the same content twice runs pandoc once."""
+    calls = []
+
+    def fake_convert_text(content, to, format):
+        calls.append((content, to, format))
+        return content.upper()
+
+    monkeypatch.setattr("pypandoc.convert_text", fake_convert_text)
+    converter = PandocConverter(cache_size=1, cache_dir=None)
+
+    assert converter.convert("hello", "markdown", "mediawiki") == "HELLO"
+    assert converter.convert("hello", "Markdown", "MediaWiki") == "HELLO"
+    assert converter.convert("other", "markdown", "mediawiki") == "OTHER"
+    assert converter.convert("hello", "markdown", "mediawiki") == "HELLO"
+    assert len(calls) == 3
+
+
+def test_pandoc_convert_many_runs_each_distinct_document_once(monkeypatch):
+    """Batch conversion keeps input order and skips duplicates and cached input."""
+    calls = []
+
+    def fake_convert_text(content, to, format):
+        calls.append(content)
+        return content.upper()
+
+    monkeypatch.setattr("pypandoc.convert_text", fake_convert_text)
+    converter = PandocConverter(cache_dir=None)
+    converter.convert("a", "markdown", "mediawiki")
+
+    converted = converter.convert_many(["b", "a", "c", "b"], "markdown", "mediawiki")
+
+    assert converted == ["B", "A", "C", "B"]
+    assert sorted(calls) == ["a", "b", "c"]
+
+
+def test_pandoc_results_persist_on_disk(monkeypatch, tmp_path):
+    """A fresh converter reuses results persisted by an earlier one."""
+    calls = []
+
+    def fake_convert_text(content, to, format):
+        calls.append(content)
+        return content.upper()
+
+    monkeypatch.setattr("pypandoc.convert_text", fake_convert_text)
+
+    first = PandocConverter(cache_dir=str(tmp_path))
+    second = PandocConverter(cache_dir=str(tmp_path))
+
+    assert first.convert("hello", "markdown", "mediawiki") == "HELLO"
+    assert second.convert("hello", "markdown", "mediawiki") == "HELLO"
+    assert second.convert("hello", "markdown", "html") == "HELLO"
+    assert len(calls) == 2
+
+
+def test_infer_format_from_filename():
+    """Formats are looked up by the last extension, case-insensitively."""
+    assert infer_format_from_filename("docs/Page.MD") == "markdown"
+    assert infer_format_from_filename("archive.tar.wiki") == "mediawiki"
+    assert infer_format_from_filename("README") == "unknown"
+    assert infer_format_from_filename("image.png") == "unknown"
+    assert infer_format_from_filename("") == "unknown"
+
+
+def test_pandoc_writes_output_file_directly(monkeypatch, tmp_path):
+    """Pandoc writes the file itself; later conversions copy the cached file."""
+    calls = []
+
+    def fake_convert_text(content, to, format, outputfile=None):
+        calls.append(outputfile)
+        with open(outputfile, "w", encoding="utf-8") as f:
+            f.write(content.upper())
+        return ""
+
+    monkeypatch.setattr("pypandoc.convert_text", fake_convert_text)
+    converter = PandocConverter(cache_dir=str(tmp_path / "conv"))
+    first = tmp_path / "first.md"
+    second = tmp_path / "second.md"
+
+    converter.convert_to_file("héllo", "mediawiki", "markdown", str(first))
+    converter.convert_to_file("héllo", "mediawiki", "markdown", str(second))
+
+    assert calls == [str(first)]
+    assert second.read_text(encoding="utf-8") == "HÉLLO"
+    assert converter.convert("héllo", "mediawiki", "markdown") == "HÉLLO"
+
+
+def test_uncached_conversion_leaves_registered_converter_alone(monkeypatch, tmp_path):
+    """Conversions without the cache neither read nor change the shared one."""
+    calls = []
+
+    def fake_convert_text(content, to, format):
+        calls.append(content)
+        return content.upper()
+
+    monkeypatch.setattr("pypandoc.convert_text", fake_convert_text)
+    registered = ContentConverterRegistry.get_converter("markdown", "mediawiki")
+    monkeypatch.setattr(registered, "cache_dir", str(tmp_path))
+    registered.convert("hello", "markdown", "mediawiki")
+
+    assert (
+        ContentConverterRegistry.convert(
+            "hello", "markdown", "mediawiki", use_cache=False
+        )
+        == "HELLO"
+    )
+    ContentConverterRegistry.convert("other", "markdown", "mediawiki", use_cache=False)
+
+    assert calls == ["hello", "hello", "other"]
+    assert registered.cache_dir == str(tmp_path)
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_pandoc_results_are_keyed_by_pandoc_installation(monkeypatch, tmp_path):
+    """Results persisted by another pandoc installation are not reused."""
+    calls = []
+
+    def fake_convert_text(content, to, format):
+        calls.append(content)
+        return content.upper()
+
+    monkeypatch.setattr("pypandoc.convert_text", fake_convert_text)
+    monkeypatch.setattr("pywikicli.converters._pandoc_identity", lambda: "2.19")
+    PandocConverter(cache_dir=str(tmp_path)).convert("hello", "markdown", "mediawiki")
+    monkeypatch.setattr("pywikicli.converters._pandoc_identity", lambda: "3.1")
+    PandocConverter(cache_dir=str(tmp_path)).convert("hello", "markdown", "mediawiki")
+
+    assert calls == ["hello", "hello"]
+
+
+def test_unused_pandoc_results_are_pruned(monkeypatch, tmp_path):
+    """Storing a result deletes persisted results unused for too long."""
+    monkeypatch.setattr("pypandoc.convert_text", lambda content, to, format: content)
+    stale = tmp_path / "stale.mediawiki"
+    recent = tmp_path / "recent.mediawiki"
+    stale.write_text("old")
+    recent.write_text("new")
+    long_ago = time.time() - CONVERSION_CACHE_MAX_AGE - 60
+    os.utime(stale, (long_ago, long_ago))
+
+    PandocConverter(cache_dir=str(tmp_path)).convert("hello", "markdown", "mediawiki")
+
+    assert not stale.exists()
+    assert recent.exists()
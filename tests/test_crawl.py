@@ -0,0 +1,222 @@
+"""
+Tests for the crawl command's crawler service.
+"""
+
+import time
+
+import pytest
+
+from pywikicli.commands.crawl_command import (
+    BreadthFirstStrategy,
+    DepthFirstStrategy,
+    FileOutputProcessor,
+    PageProcessor,
+    WikiCrawlerService,
+    _title_to_filename,
+)
+
+
+class FakeWikiClient:
+    """In-memory wiki used in place of the MediaWiki API."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.batches = []
+
+    def get_page(self, title):
+        if title not in self.pages:
+            return None
+        return f"content of {title}"
+
+    def get_links(self, title):
+        return list(self.pages.get(title, []))
+
+    def get_pages_batch(self, titles):
+        self.batches.append(list(titles))
+        return {title: self.get_page(title) for title in titles}
+
+    def get_links_batch(self, titles):
+        return {title: self.get_links(title) for title in titles}
+
+
+class RecordingProcessor(PageProcessor):
+    """Processor that records processed page titles."""
+
+    def __init__(self):
+        self.titles = []
+
+    def process(self, page_title, content):
+        self.titles.append(page_title)
+
+
+PAGES = {
+    "Root": ["A", "B"],
+    "A": ["A1", "Missing"],
+    "B": ["B1", "Root"],
+    "A1": [],
+    "B1": ["Deep"],
+    "Deep": [],
+}
+
+
+@pytest.mark.parametrize(
+    "strategy, expected",
+    [
+        (BreadthFirstStrategy(), ["Root", "A", "B", "A1", "B1"]),
+        (DepthFirstStrategy(), ["Root", "B", "B1", "A", "A1"]),
+    ],
+)
+def test_sequential_crawl_order(strategy, expected):
+    """With a single worker and no batching, pages are visited in strategy order."""
+    processor = RecordingProcessor()
+    crawler = WikiCrawlerService(
+        FakeWikiClient(PAGES),
+        processor,
+        strategy,
+        max_concurrent_requests=1,
+        batch_size=1,
+    )
+
+    stats = crawler.crawl("Root", max_depth=2, limit=100)
+
+    assert processor.titles == expected
+    assert stats["pages_processed"] == 5
+    assert stats["pages_discovered"] == 6
+
+
+def test_concurrent_crawl_respects_limit():
+    """Concurrent crawls never process more pages than the limit."""
+    processor = RecordingProcessor()
+    crawler = WikiCrawlerService(
+        FakeWikiClient(PAGES),
+        processor,
+        BreadthFirstStrategy(),
+        max_concurrent_requests=8,
+    )
+
+    stats = crawler.crawl("Root", max_depth=5, limit=3)
+
+    assert stats["pages_processed"] == 3
+    assert len(processor.titles) == 3
+    assert processor.titles[0] == "Root"
+
+
+def test_crawl_fetches_queued_pages_in_batches():
+    """Queued pages are drained into one batched request per level."""
+    client = FakeWikiClient(PAGES)
+    crawler = WikiCrawlerService(
+        client, RecordingProcessor(), BreadthFirstStrategy(), max_concurrent_requests=1
+    )
+
+    crawler.crawl("Root", max_depth=2, limit=100)
+
+    assert client.batches == [["Root"], ["A", "B"], ["A1", "Missing", "B1"]]
+
+
+def test_crawl_uses_custom_visited_container():
+    """Discovered titles are tracked in the container from visited_factory."""
+
+    class RecordingSet(set):
+        pass
+
+    crawler = WikiCrawlerService(
+        FakeWikiClient(PAGES),
+        RecordingProcessor(),
+        BreadthFirstStrategy(),
+        visited_factory=RecordingSet,
+    )
+
+    stats = crawler.crawl("Root", max_depth=2, limit=100)
+
+    assert isinstance(crawler.visited, RecordingSet)
+    assert stats["pages_discovered"] == len(crawler.visited) == 6
+
+
+def test_file_processor_writes_pages_by_close(tmp_path):
+    """Queued writes are on disk once the crawl has finished."""
+    processor = FileOutputProcessor(str(tmp_path))
+    crawler = WikiCrawlerService(
+        FakeWikiClient(PAGES), processor, BreadthFirstStrategy()
+    )
+
+    crawler.crawl("Root", max_depth=1, limit=100)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["A.txt", "B.txt", "Root.txt"]
+    assert (tmp_path / "A.txt").read_text(encoding="utf-8") == "content of A"
+
+
+def test_file_processor_bounds_pending_writes(tmp_path):
+    """No more than max_pending writes are queued at once."""
+    processor = FileOutputProcessor(str(tmp_path), max_pending=2)
+
+    for i in range(10):
+        processor.process(f"Page {i}", "text")
+        assert len(processor._writes) <= 2
+    processor.close()
+
+    assert len(list(tmp_path.iterdir())) == 10
+
+
+def test_file_processor_serializes_colliding_writes(tmp_path, monkeypatch):
+    """Titles mapping to the same file are written one after the other."""
+    active = []
+    overlaps = []
+    write = FileOutputProcessor._write
+
+    def slow_write(page_title, safe_name, path, content):
+        active.append(path)
+        if active.count(path) > 1:
+            overlaps.append(path)
+        time.sleep(0.05)
+        write(page_title, safe_name, path, content)
+        active.remove(path)
+
+    monkeypatch.setattr(FileOutputProcessor, "_write", staticmethod(slow_write))
+    processor = FileOutputProcessor(str(tmp_path), max_workers=2)
+
+    processor.process("A:B", "first")
+    processor.process("A?B", "second")
+    processor.close()
+
+    assert not overlaps
+    assert (tmp_path / "A_B.txt").read_text(encoding="utf-8") == "second"
+
+
+def test_title_to_filename_replaces_unsafe_characters():
+    """Characters that are invalid in file names become underscores."""
+    assert _title_to_filename("Help:A/B C?") == "Help_A_B_C_.txt"
+
+
+def test_crawl_rate_limit_option_overrides_config(monkeypatch):
+    """--rate-limit takes precedence over the configured request rate."""
+    from click.testing import CliRunner
+
+    from pywikicli.cli import cli
+
+    created = {}
+
+    class RecordingClient(FakeWikiClient):
+        titles_per_request = 50
+
+        def __init__(self, api_url, **kwargs):
+            super().__init__({})
+            created.update(kwargs)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            pass
+
+    monkeypatch.setattr("pywikicli.commands.crawl_command.WikiClient", RecordingClient)
+    monkeypatch.setattr(
+        "pywikicli.cli.load_config",
+        lambda: {"api_url": "https://wiki.example.com/w/api.php", "rate_limit": 60},
+    )
+
+    result = CliRunner().invoke(
+        cli, ["crawl", "Root", "--no-cache", "--rate-limit", "30"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert created["rate_limit"] == 30
@@ -0,0 +1,44 @@
+"""
+Tests for the get command.
+"""
+
+from click.testing import CliRunner
+
+from pywikicli.cli import cli
+from pywikicli.converters import ContentConverterRegistry
+
+CONFIG = {"api_url": "https://wiki.example.com/w/api.php"}
+
+
+class FakeClient:
+    """Client that serves one fixed page."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def get_page(self, title):
+        return "== Heading ==\nText"
+
+
+def test_get_wiki_format_is_written_without_conversion(monkeypatch, tmp_path):
+    """Saving as wiki text writes the page as fetched."""
+    monkeypatch.setattr("pywikicli.api.WikiClient", FakeClient)
+    monkeypatch.setattr("pywikicli.cli.load_config", lambda: dict(CONFIG))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("no conversion expected")
+
+    monkeypatch.setattr(ContentConverterRegistry, "convert_to_file", fail)
+    monkeypatch.chdir(tmp_path)
+
+    result = CliRunner().invoke(
+        cli, ["get", "Main Page", "-o", "wiki", "-w", "--no-cache"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "Main_Page.wiki").read_text(encoding="utf-8") == (
+        "== Heading ==\nText"
+    )
@@ -0,0 +1,21 @@
+"""
+Tests for the JSON helpers.
+"""
+
+import pytest
+
+from pywikicli import jsonutil
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_roundtrip(monkeypatch, use_orjson):
+    """Both the orjson and the standard library paths round-trip data."""
+    if not use_orjson:
+        monkeypatch.setattr(jsonutil, "orjson", None)
+    elif jsonutil.orjson is None:
+        pytest.skip("orjson is not installed")
+    value = {"title": "Tëst", "links": [1, 2]}
+
+    assert jsonutil.loads(jsonutil.dumps(value)) == value
+    assert jsonutil.loads(jsonutil.dumps(value).encode("utf-8")) == value
+    assert jsonutil.dumps(value, indent=True).startswith('{\n  "title"')
@@ -0,0 +1,102 @@
+"""
+Tests for the put command.
+"""
+
+import pytest
+from click.testing import CliRunner
+
+from pywikicli.cache import PageCache
+from pywikicli.cli import cli
+from pywikicli.commands.put_command import PageNameExtractor, PutCommandService
+
+CONFIG = {
+    "api_url": "https://wiki.example.com/w/api.php",
+    "username": "u",
+    "password": "p",
+}
+
+
+class FakeClient:
+    """Client that records edits instead of sending them."""
+
+    instances = []
+
+    def __init__(self, *args, **kwargs):
+        self.options = kwargs
+        self.edits = []
+        self.closed = False
+        FakeClient.instances.append(self)
+
+    def close(self):
+        self.closed = True
+
+    def edit_page(self, title, content, summary="", **options):
+        self.edits.append((title, content))
+        return True
+
+    def get_page_url(self, page_title):
+        return None
+
+
+@pytest.fixture(autouse=True)
+def tmp_page_cache(monkeypatch, tmp_path):
+    """Keep the page cache of put out of the user's cache directory."""
+    path = str(tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(
+        "pywikicli.commands.put_command.PageCache", lambda: PageCache(path)
+    )
+
+
+def test_put_uploads_several_files_with_one_client(monkeypatch, tmp_path):
+    """All files given on the command line are edited through one client."""
+    monkeypatch.setattr("pywikicli.api.WikiClient", FakeClient)
+    monkeypatch.setattr("pywikicli.cli.load_config", lambda: dict(CONFIG))
+    FakeClient.instances = []
+    first = tmp_path / "First_Page.wiki"
+    second = tmp_path / "Second.wiki"
+    first.write_text("one", encoding="utf-8")
+    second.write_text("two", encoding="utf-8")
+
+    result = CliRunner().invoke(cli, ["put", str(first), str(second)])
+
+    assert result.exit_code == 0, result.output
+    assert len(FakeClient.instances) == 1
+    assert FakeClient.instances[0].edits == [("First Page", "one"), ("Second", "two")]
+    assert FakeClient.instances[0].closed
+    # Edited pages must be evicted from the cache get reads from
+    assert isinstance(FakeClient.instances[0].options["cache"], PageCache)
+
+
+def test_put_rejects_pagename_with_several_files(monkeypatch, tmp_path):
+    """--pagename is ambiguous when more than one file is given."""
+    monkeypatch.setattr("pywikicli.api.WikiClient", FakeClient)
+    monkeypatch.setattr("pywikicli.cli.load_config", lambda: dict(CONFIG))
+    FakeClient.instances = []
+    (tmp_path / "a.wiki").write_text("a", encoding="utf-8")
+    (tmp_path / "b.wiki").write_text("b", encoding="utf-8")
+
+    result = CliRunner().invoke(
+        cli, ["put", "-p", "X", str(tmp_path / "a.wiki"), str(tmp_path / "b.wiki")]
+    )
+
+    assert "single file" in result.output
+    assert FakeClient.instances == []
+
+
+def test_page_name_from_filename():
+    """Page names drop the directory and last extension and use spaces."""
+    assert PageNameExtractor.from_filename("docs/My_Page.md") == "My Page"
+    assert PageNameExtractor.from_filename("v1.2_notes.wiki") == "v1.2 notes"
+    assert PageNameExtractor.from_filename("README") == "README"
+    assert PageNameExtractor.from_filename(".hidden") == ".hidden"
+
+
+def test_load_content_from_file_decodes_utf8(tmp_path):
+    """Files are read as UTF-8 with line endings normalized."""
+    path = tmp_path / "Page.md"
+    path.write_bytes("# Tïtle\r\n\r\nBody\n".encode("utf-8"))
+
+    content, source_format = PutCommandService(None).load_content_from_file(str(path))
+
+    assert content == "# Tïtle\n\nBody\n"
+    assert source_format == "markdown"
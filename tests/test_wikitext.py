@@ -0,0 +1,16 @@
+"""
+Tests for the wikitext helpers.
+"""
+
+from pywikicli.wikitext import extract_links
+
+
+def test_extract_links_normalizes_targets():
+    """Link targets are normalized and deduplicated in order."""
+    content = (
+        "See [[main_Page]], [[Help:Editing|editing help]] and "
+        "[[Main Page#History|history]]. [[Category:Docs]] [[File:Logo.png|thumb]] "
+        "[[:Category:Docs]] [[#Local section]]"
+    )
+
+    assert extract_links(content) == ["Main Page", "Help:Editing", "Category:Docs"]